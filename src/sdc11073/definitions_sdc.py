@@ -11,8 +11,6 @@ from .xml_types import actions, msg_qnames, msg_types, pm_qnames, pm_types
 if TYPE_CHECKING:
     from types import ModuleType
 
-    from lxml.etree import QName
-
     from .namespaces import NamespaceHelper
 
 
@@ -23,13 +21,10 @@ class V1Model(AbstractDataModel):
         super().__init__()
         self._ns_hlp = ns_hlp
 
-    def get_descriptor_container_class(self, type_qname: QName) -> type:
-        """Get the class that represents a BICEPS descriptor entity with given QName."""
-        return get_descriptor_container_class(type_qname)
-
-    def get_state_container_class(self, type_qname: QName) -> type:
-        """Get the class that represents a BICEPS state entity with given QName."""
-        return get_state_container_class(type_qname)
+    # The lookup functions are bound dict.get methods; exposing them directly avoids a python call frame
+    # per descriptor and state when a mdib is read.
+    get_descriptor_container_class = staticmethod(get_descriptor_container_class)
+    get_state_container_class = staticmethod(get_state_container_class)
 
     @property
     def pm_types(self) -> ModuleType:
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import copy
-import inspect
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from lxml.etree import Element, SubElement, QName
 
 from sdc11073 import observableproperties as properties
 from sdc11073.namespaces import QN_TYPE, NamespaceHelper
 from sdc11073 import xml_utils
+from sdc11073.xml_types.xml_structure import collect_class_properties
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Mapping
 
 
 class ContainerBase:
@@ -24,15 +28,34 @@ class ContainerBase:
     # rule is : elements are sorted from this root class to derived class. Last derived class comes last.
     # Initialization is from left to right
     # This is according to the inheritance in BICEPS xml schema
+    # The merged result of all _props lists is calculated once per class in __init_subclass__.
+    _sorted_container_properties: tuple = ()
+    _container_properties_by_name: ClassVar[Mapping[str, Any]] = MappingProxyType({})
+    # bound update methods of all properties, in the same order. Calling them directly avoids attribute lookups.
+    _init_instance_data_methods: tuple = ()
+    _update_xml_value_methods: tuple = ()
+    _update_from_node_methods: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        (cls._sorted_container_properties,
+         cls._init_instance_data_methods,
+         cls._update_xml_value_methods,
+         cls._update_from_node_methods) = collect_class_properties(cls)
+        cls._container_properties_by_name = MappingProxyType(dict(cls._sorted_container_properties))
 
     def __init__(self):
         self.node = None  # set in update_from_node
-        for _, cprop in self.sorted_container_properties():
-            cprop.init_instance_data(self)
+        for init_instance_data in self._init_instance_data_methods:
+            init_instance_data(self)
 
     def get_actual_value(self, attr_name: str) -> Any:
         """Ignore default value and implied value, e.g. return None if value is not present in xml."""
-        return getattr(self.__class__, attr_name).get_actual_value(self)
+        try:
+            prop = self._container_properties_by_name[attr_name]
+        except KeyError:
+            prop = getattr(self.__class__, attr_name)
+        return prop.get_actual_value(self)
 
     def mk_node(self,
                 tag: QName,
@@ -70,20 +93,20 @@ class ContainerBase:
         """
         if set_xsi_type and self.NODETYPE is not None:
             node.set(QN_TYPE, ns_helper.doc_name_from_qname(self.NODETYPE))
-        for _, prop in self.sorted_container_properties():
-            prop.update_xml_value(self, node)
+        for update_xml_value in self._update_xml_value_methods:
+            update_xml_value(self, node)
         return node
 
     def update_from_node(self, node: xml_utils.LxmlElement):
         """Update members from node."""
-        for _, cprop in self.sorted_container_properties():
-            cprop.update_from_node(self, node)
+        for update_from_node in self._update_from_node_methods:
+            update_from_node(self, node)
         self.node = node
 
-    def _update_from_other(self, other_container: ContainerBase, skipped_properties: list[str] | None):
+    def _update_from_other(self, other_container: ContainerBase, skipped_properties: Collection[str] | None):
         """Update all ContainerProperties."""
         if skipped_properties is None:
-            skipped_properties = []
+            skipped_properties = ()
         for prop_name, _ in self.sorted_container_properties():
             if prop_name not in skipped_properties:
                 new_value = getattr(other_container, prop_name)
@@ -96,23 +119,12 @@ class ContainerBase:
             copied.node = xml_utils.copy_element(self.node)
         return copied
 
-    def sorted_container_properties(self) -> list:
-        """Return a list of (name, object) tuples of all GenericProperties ( and subclasses).
+    def sorted_container_properties(self) -> tuple:
+        """Return a tuple of (name, object) tuples of all GenericProperties ( and subclasses).
 
         Base class properties are first.
         """
-        ret = []
-        all_classes = inspect.getmro(self.__class__)
-        for cls in reversed(all_classes):
-            try:
-                names = cls.__dict__['_props']
-            except KeyError:
-                continue
-            for name in names:
-                obj = getattr(cls, name)
-                if obj is not None:
-                    ret.append((name, obj))
-        return ret
+        return self._sorted_container_properties
 
     def diff(self, other: ContainerBase, ignore_property_names: list[str] | None = None) -> None | list[str]:
         """Compare all properties (except to be ignored ones).
@@ -123,10 +135,10 @@ class ContainerBase:
         """
         max_float_diff = 1e-6  # if difference is less or equal, two floats are considered equal
         ret = []
-        ignore_list = ignore_property_names or []
+        ignore_set = set(ignore_property_names) if ignore_property_names else ()
         my_properties = self.sorted_container_properties()
         for name, _ in my_properties:
-            if name in ignore_list:
+            if name in ignore_set:
                 continue
             my_value = getattr(self, name)
             try:
@@ -144,12 +156,13 @@ class ContainerBase:
                             ret.append(f'{name}={my_value}, other={other_value}')
                 elif my_value != other_value:
                     ret.append(f'{name}={my_value}, other={other_value}')
-        # check also if other has a different list of properties
-        my_property_names = {p[0] for p in my_properties}  # set comprehension
-        other_property_names = {p[0] for p in other.sorted_container_properties()}
-        surplus_names = other_property_names - my_property_names
-        if surplus_names:
-            ret.append(f'other has more data elements:{surplus_names}')
+        # check also if other has a different list of properties, not needed if other has the same class
+        if other.__class__ is not self.__class__:
+            my_property_names = {p[0] for p in my_properties}  # set comprehension
+            other_property_names = {p[0] for p in other.sorted_container_properties()}
+            surplus_names = other_property_names - my_property_names
+            if surplus_names:
+                ret.append(f'other has more data elements:{surplus_names}')
         return None if len(ret) == 0 else ret
 
     def is_equal(self, other: ContainerBase) -> bool:
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import sys
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, ClassVar, Protocol
 
 from sdc11073 import observableproperties as properties
+from sdc11073.namespaces import default_ns_helper
 from sdc11073.xml_types import ext_qnames as ext
 from sdc11073.xml_types import msg_qnames as msg
 from sdc11073.xml_types import pm_qnames, pm_types
@@ -14,7 +17,7 @@ from sdc11073.xml_types import xml_structure as x_struct
 from .containerbase import ContainerBase
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Collection, Iterable
     from decimal import Decimal
 
     from lxml import etree as etree_
@@ -44,16 +47,90 @@ class ChildDescriptorMapping:
         return f'{self.__class__.__name__} name={self.child_qname.localname} types={types}'
 
 
-def sorted_child_data(obj: Any, member_name: str):
-    """:return: an iterator with whatever the members have, starting with base class members"""
-    classes = inspect.getmro(obj.__class__)
-    for cls in reversed(classes):
-        try:
-            names = cls.__dict__[member_name]  # only access class member of this class, not parent
-            for name in names:
-                yield name
-        except KeyError:
+_MISSING = object()  # sentinel for attributes that do not exist
+
+
+@functools.lru_cache(maxsize=None)
+def _sorted_child_data_of_class(obj_cls: type, member_name: str) -> tuple:
+    """Collect the members of all classes in mro, starting with base class members.
+
+    The result only depends on the class, therefore it is cached.
+    """
+    ret = []
+    for cls in reversed(obj_cls.__mro__):
+        members = cls.__dict__.get(member_name)  # only access class member of this class, not parent
+        if members is not None:
+            ret.extend(members)
+    return tuple(ret)
+
+
+def sorted_child_data(obj: Any, member_name: str) -> tuple:
+    """:return: a tuple with whatever the members have, starting with base class members"""
+    return _sorted_child_data_of_class(obj.__class__, member_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _child_tag_lookup_of_class(obj_cls: type) -> dict[etree_.QName, tuple[etree_.QName, bool]]:
+    """Map node type of child descriptors to tuple(tag name, set_xsi_type_flag).
+
+    The first matching ChildDescriptorMapping in mro wins, starting with base class members.
+    """
+    lookup = {}
+    for child in _sorted_child_data_of_class(obj_cls, '_child_descriptor_name_mappings'):
+        if child.node_types is None:
             continue
+        set_xsi_type = len(child.node_types) > 1
+        for node_type in child.node_types:
+            lookup.setdefault(node_type, (child.child_qname, set_xsi_type))
+    return lookup
+
+
+@functools.lru_cache(maxsize=None)
+def _child_element_positions_of_class(obj_cls: type) -> dict[str, int]:
+    """Map tag names of child elements to their position in BICEPS schema order.
+
+    The keys are the tag texts in clark notation, lxml elements return their tag as such a string.
+    """
+    positions = {}
+    for q_name in _sorted_child_data_of_class(obj_cls, '_child_elements_order'):
+        positions.setdefault(q_name.text, len(positions))
+    return positions
+
+
+@dataclass(frozen=True)
+class ChildDescriptorSlots:
+    """Layout of the child elements of a descriptor class.
+
+    Needed when building a xml tree of descriptors. Every tag name that is used for child descriptors has its own slot,
+    the child descriptors are collected per slot and then written in the order of element_slots.
+    """
+
+    # one entry per child element in BICEPS order: tuple(tag, slot index or None, set_xsi_type_flag).
+    # The tag is the text of the QName, this allows cheap comparison with the tag of lxml elements.
+    element_slots: tuple[tuple[str, int | None, bool], ...]
+    slot_lookup: dict[etree_.QName, int]  # maps node type of a child descriptor to its slot index
+    slots_count: int
+
+
+@functools.lru_cache(maxsize=None)
+def _child_descriptor_slots_of_class(obj_cls: type) -> ChildDescriptorSlots:
+    tag_lookup = _child_tag_lookup_of_class(obj_cls)
+    set_xsi_type_by_tag = dict(tag_lookup.values())
+    element_slots = []
+    slot_index_by_tag = {}
+    for q_name in _sorted_child_data_of_class(obj_cls, '_child_elements_order'):
+        if q_name in set_xsi_type_by_tag:
+            slot_index_by_tag[q_name] = len(slot_index_by_tag)
+            element_slots.append((q_name.text, slot_index_by_tag[q_name], set_xsi_type_by_tag[q_name]))
+        else:
+            element_slots.append((q_name.text, None, False))
+    slot_lookup = {node_type: slot_index_by_tag[tag] for node_type, (tag, _) in tag_lookup.items()}
+    return ChildDescriptorSlots(tuple(element_slots), slot_lookup, len(slot_index_by_tag))
+
+
+def child_descriptor_slots(obj: Any) -> ChildDescriptorSlots:
+    """:return: the ChildDescriptorSlots of the class of obj"""
+    return _child_descriptor_slots_of_class(obj.__class__)
 
 
 class AbstractDescriptorProtocol(Protocol):
@@ -138,15 +215,18 @@ class AbstractDescriptorContainer(ContainerBase):
 
     @property
     def coding(self) -> pm_types.Coding | None:  # noqa: D102
-        return self.Type.coding if self.Type is not None else None
+        type_ = self.Type  # read the property only once
+        return None if type_ is None else type_.coding
 
     @property
     def code_id(self) -> str | None:  # noqa: D102
-        return self.Type.Code if self.Type is not None else None  # pylint:disable=no-member
+        type_ = self.Type
+        return None if type_ is None else type_.Code
 
     @property
     def coding_system(self) -> str | None:  # noqa: D102
-        return self.Type.CodingSystem if self.Type is not None else None  # pylint:disable=no-member
+        type_ = self.Type
+        return None if type_ is None else type_.CodingSystem
 
     @property
     def parent_handle(self) -> str:  # noqa: D102
@@ -171,7 +251,7 @@ class AbstractDescriptorContainer(ContainerBase):
         self.DescriptorVersion += 1
 
     def update_from_other_container(self, other: AbstractDescriptorContainer,
-                                    skipped_properties: list[str] | None = None):
+                                    skipped_properties: Collection[str] | None = None):
         """Update own properties with values from other descriptor."""
         if other.Handle != self.Handle:
             raise ValueError(
@@ -179,10 +259,6 @@ class AbstractDescriptorContainer(ContainerBase):
                 f'Have "{self.Handle}", got "{other.Handle}"')
         self._update_from_other(other, skipped_properties)
 
-    def get_actual_value(self, attr_name: str) -> Any:
-        """Ignores default value and implied value, e.g. returns None if value is not present in xml."""
-        return getattr(self.__class__, attr_name).get_actual_value(self)
-
     def diff(self, other: AbstractDescriptorContainer, ignore_property_names: list[str] | None = None) -> None | list[
         str]:
         """Compare with another descriptor.
@@ -195,29 +271,29 @@ class AbstractDescriptorContainer(ContainerBase):
         ret = super().diff(other, ignore_property_names) or []
         if ignore_property_names is None or 'parent_handle' not in ignore_property_names:
             my_value = self.parent_handle
-            try:
+            if isinstance(other, AbstractDescriptorContainer):  # the usual case, attribute is known to exist
                 other_value = other.parent_handle
-            except AttributeError:
-                ret.append(f'parent_handle={my_value}, other does not have this attribute')
             else:
-                if my_value != other_value:
-                    ret.append(f'parent_handle={my_value}, other={other_value}')
+                other_value = getattr(other, 'parent_handle', _MISSING)
+            if other_value is _MISSING:
+                ret.append(f'parent_handle={my_value}, other does not have this attribute')
+            elif my_value != other_value:
+                ret.append(f'parent_handle={my_value}, other={other_value}')
         return None if len(ret) == 0 else ret
 
     def tag_name_for_child_descriptor(self, node_type: etree_.QName) -> (etree_.QName, bool):
         """Determine the tag name of a child descriptor.
 
         This isneeded when the xml tree of the descriptor is created.
-        It uses the _child_elements_order members of the class itself and its base classes
-        which map node type to tag name.
+        It uses the _child_descriptor_name_mappings members of the class itself and its base classes
+        which map node type to tag name. The resulting lookup is built once per class.
         :param node_type: the type QName (NODETYPE member)
         :return: tuple(QName, set_xsi_type_flag).
         """
-        for child in sorted_child_data(self, '_child_descriptor_name_mappings'):
-            if child.node_types is not None and node_type in child.node_types:
-                set_xsi_type = len(child.node_types) > 1
-                return child.child_qname, set_xsi_type
-        raise ValueError(f'{node_type} not known in child declarations of {self.__class__.__name__}')
+        try:
+            return _child_tag_lookup_of_class(self.__class__)[node_type]
+        except KeyError:
+            raise ValueError(f'{node_type} not known in child declarations of {self.__class__.__name__}') from None
 
     def sort_child_nodes(self, node: xml_utils.LxmlElement) -> None:
         """Bring all child elements of node in correct order (BICEPS schema).
@@ -225,18 +301,16 @@ class AbstractDescriptorContainer(ContainerBase):
         raises a ValueError if a child node exist that is not listed in ordered_tags
         :param node: the element to be sorted.
         """
-        q_names = list(sorted_child_data(self, '_child_elements_order'))
-        not_in_order = [n for n in node if n.tag not in q_names]
-        if len(not_in_order) > 0:
-            raise ValueError(f'{self.__class__.__name__}: not in Order:{[n.tag for n in not_in_order]} '
-                             f'node={node.tag}, order={[o.localname for o in q_names]}')
+        positions = _child_element_positions_of_class(self.__class__)
         all_child_nodes = node[:]
-        for child_node in all_child_nodes:
-            node.remove(child_node)
-        for q_name in q_names:
-            for child_node in all_child_nodes:
-                if child_node.tag == q_name:
-                    node.append(child_node)
+        try:
+            node[:] = sorted(all_child_nodes, key=lambda n: positions[n.tag])
+        except KeyError:
+            # build the error message only if there is an error
+            q_names = sorted_child_data(self, '_child_elements_order')
+            not_in_order = [n.tag for n in all_child_nodes if n.tag not in positions]
+            raise ValueError(f'{self.__class__.__name__}: not in Order:{not_in_order} '
+                             f'node={node.tag}, order={[o.localname for o in q_names]}') from None
 
     def set_source_mds(self, handle: str):
         """Set source_mds member."""
@@ -247,16 +321,13 @@ class AbstractDescriptorContainer(ContainerBase):
         """Get source mds handle."""
         return self._source_mds
 
-    def __str__(self) -> str:
-        name = self.NODETYPE.localname or None
-        return (f'Descriptor "{name}": handle={self.Handle} descriptor version={self.DescriptorVersion} '
-                f'parent handle={self.parent_handle}')
-
     def __repr__(self) -> str:
         name = self.NODETYPE.localname or None
         return (f'Descriptor "{name}": handle={self.Handle} descriptor version={self.DescriptorVersion} '
                 f'parent={self.parent_handle}')
 
+    __str__ = __repr__
+
     @classmethod
     def from_node(cls, node: xml_utils.LxmlElement, parent_handle: str | None = None) -> AbstractDescriptorContainer:
         """Create class and init its properties from the node."""
@@ -770,31 +841,38 @@ class EnsembleContextDescriptorContainer(AbstractContextDescriptorContainer):
 _classes = inspect.getmembers(sys.modules[__name__],
                               lambda member: inspect.isclass(member) and member.__module__ == __name__)
 _classes_with_nodetype = [c[1] for c in _classes if hasattr(c[1], 'NODETYPE') and c[1].NODETYPE is not None]
-# make a dictionary from found classes: (Key is NODETYPE, value is the class itself
-
-_name_class_lookup = {c.NODETYPE: c for c in _classes_with_nodetype}
-
-_name_class_xtra_lookup = {
-    pm_qnames.Battery: BatteryDescriptorContainer,
-    pm_qnames.Mds: MdsDescriptorContainer,
-    pm_qnames.Vmd: VmdDescriptorContainer,
-    pm_qnames.Sco: ScoDescriptorContainer,
-    pm_qnames.Channel: ChannelDescriptorContainer,
-    pm_qnames.Clock: ClockDescriptorContainer,
-    pm_qnames.SystemContext: SystemContextDescriptorContainer,
-    pm_qnames.PatientContext: PatientContextDescriptorContainer,
-    pm_qnames.LocationContext: LocationContextDescriptorContainer,
-    pm_qnames.WorkflowContext: WorkflowContextDescriptorContainer,
-    pm_qnames.OperatorContext: OperatorContextDescriptorContainer,
-    pm_qnames.MeansContext: MeansContextDescriptorContainer,
-    pm_qnames.EnsembleContext: EnsembleContextDescriptorContainer,
-    pm_qnames.AlertSystem: AlertSystemDescriptorContainer,
-    pm_qnames.AlertCondition: AlertConditionDescriptorContainer,
-    pm_qnames.AlertSignal: AlertSignalDescriptorContainer,
-}
-_name_class_lookup.update(_name_class_xtra_lookup)
-
-
-def get_container_class(qname: etree_.QName) -> type[AbstractDescriptorContainer]:
-    """:param qname: a QName instance"""
-    return _name_class_lookup.get(qname)
+
+# descriptors that are also found by their element name, which is the type name without the "Descriptor" suffix,
+# e.g. pm:Mds for pm:MdsDescriptor
+_classes_with_element_name = (
+    BatteryDescriptorContainer,
+    MdsDescriptorContainer,
+    VmdDescriptorContainer,
+    ScoDescriptorContainer,
+    ChannelDescriptorContainer,
+    ClockDescriptorContainer,
+    SystemContextDescriptorContainer,
+    PatientContextDescriptorContainer,
+    LocationContextDescriptorContainer,
+    WorkflowContextDescriptorContainer,
+    OperatorContextDescriptorContainer,
+    MeansContextDescriptorContainer,
+    EnsembleContextDescriptorContainer,
+    AlertSystemDescriptorContainer,
+    AlertConditionDescriptorContainer,
+    AlertSignalDescriptorContainer,
+)
+_name_class_xtra_lookup = {default_ns_helper.PM.tag(c.NODETYPE.localname.removesuffix('Descriptor')): c
+                           for c in _classes_with_element_name}
+
+# make a read-only dictionary from found classes: (Key is NODETYPE or element name, value is the class itself)
+_name_class_lookup = MappingProxyType({**{c.NODETYPE: c for c in _classes_with_nodetype},
+                                       **_name_class_xtra_lookup})
+
+# same content, but keyed by the text of the QName. Looking up a str avoids QName.__eq__ calls.
+# A QName finds the same entry, because its hash and equality are those of its text.
+_name_class_lookup_by_text = {sys.intern(k.text): v for k, v in _name_class_lookup.items()}
+
+# get_container_class(qname) returns the class for a QName instance or its text in clark notation, or None.
+# It is the bound get method of the lookup, which saves a python function call per descriptor.
+get_container_class = _name_class_lookup_by_text.get
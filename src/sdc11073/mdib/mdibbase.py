@@ -10,6 +10,7 @@ from lxml import etree as etree_
 from sdc11073 import multikey
 from sdc11073 import observableproperties as properties
 from sdc11073.etc import apply_map
+from sdc11073.mdib.descriptorcontainers import child_descriptor_slots
 from sdc11073.xml_types.pm_types import Coding, have_matching_codes
 
 if TYPE_CHECKING:
@@ -137,10 +138,6 @@ class DescriptorsLookup(_MultikeyWithVersionLookup):
         with self._lock:
             self.remove_objects_no_lock(objects)
 
-    def remove_objects_no_lock(self, objects: list[AbstractDescriptorContainer]):
-        """Remove objects from table without locking."""
-        apply_map(self.remove_object_no_lock, objects)
-
     def replace_object_no_lock(self, new_obj: AbstractDescriptorContainer):
         """Remove existing descriptor_container and add new one, but do not touch child list of parent.
 
@@ -349,14 +346,19 @@ class MdibBase:
                     self._logger.error('add_state_containers: {}, DescriptorHandle={}; {}', # noqa: PLE1205
                                        ex, state_container.DescriptorHandle, traceback.format_exc())
 
-    def _reconstruct_md_description(self) -> xml_utils.LxmlElement:
-        """Build dom tree of descriptors from current data."""
+    def _reconstruct_md_description(self, parent_node: xml_utils.LxmlElement | None = None) -> xml_utils.LxmlElement:
+        """Build dom tree of descriptors from current data.
+
+        :param parent_node: if given, the MdDescription node is created as last child of parent_node.
+        """
         pm = self.data_model.pm_names
         doc_nsmap = self.nsmapper.ns_map
         root_containers = self.descriptions.parent_handle.get(None) or []
-        md_description_node = etree_.Element(pm.MdDescription,
-                                             attrib={'DescriptionVersion': str(self.mddescription_version)},
-                                             nsmap=doc_nsmap)
+        attrib = {'DescriptionVersion': str(self.mddescription_version)}
+        if parent_node is not None:
+            md_description_node = etree_.SubElement(parent_node, pm.MdDescription, attrib=attrib, nsmap=doc_nsmap)
+        else:
+            md_description_node = etree_.Element(pm.MdDescription, attrib=attrib, nsmap=doc_nsmap)
         for root_container in root_containers:
             self.make_descriptor_node(root_container, md_description_node, tag=pm.Mds, set_xsi_type=False)
         return md_description_node
@@ -374,20 +376,77 @@ class MdibBase:
         :param set_xsi_type: if true, the NODETYPE will be used to set the xsi:type attribute of the node
         :return: an etree node.
         """
+        node = self._mk_descriptor_element(descriptor_container, parent_node, tag, set_xsi_type)
+        self._update_descriptor_element(descriptor_container, node, set_xsi_type)
+        return node
+
+    def _mk_descriptor_element(self,
+                               descriptor_container: AbstractDescriptorContainer,
+                               parent_node: xml_utils.LxmlElement,
+                               tag: etree_.QName | str,
+                               set_xsi_type: bool) -> xml_utils.LxmlElement:
+        """Create the (still empty) element of a descriptor as last child of parent_node."""
         ns_map = self.nsmapper.partial_map(self.nsmapper.PM, self.nsmapper.XSI) \
             if set_xsi_type else self.nsmapper.partial_map(self.nsmapper.PM)
-        node = etree_.SubElement(parent_node,
+        return etree_.SubElement(parent_node,
                                  tag,
                                  attrib={'Handle': descriptor_container.Handle},
                                  nsmap=ns_map)
+
+    def _update_descriptor_element(self,
+                                   descriptor_container: AbstractDescriptorContainer,
+                                   node: xml_utils.LxmlElement,
+                                   set_xsi_type: bool):
+        """Write data of descriptor_container and the subtrees of all its child descriptors to node.
+
+        The tree is processed with a work list instead of recursion.
+        """
+        work_list = [(descriptor_container, node, set_xsi_type)]
+        while work_list:
+            work_list.extend(self._update_descriptor_element_shallow(*work_list.pop()))
+
+    def _update_descriptor_element_shallow(self,
+                                           descriptor_container: AbstractDescriptorContainer,
+                                           node: xml_utils.LxmlElement,
+                                           set_xsi_type: bool) -> list[tuple]:
+        """Write data of descriptor_container and the still empty elements of its child descriptors to node.
+
+        update_node writes the own child elements of the descriptor already in BICEPS schema order.
+        The elements of the child descriptors are inserted at their correct positions in between,
+        therefore no sorting of child elements is needed afterwards.
+        :return: list of (child descriptor, child element, set_xsi_type) tuples that still need to be updated.
+        """
         descriptor_container.update_node(node, self.nsmapper, set_xsi_type)  # create all
-        child_list = self.descriptions.parent_handle.get(descriptor_container.Handle, [])
-        # append all child containers, then bring all child elements in correct order
+        child_list = self.descriptions.parent_handle.get(descriptor_container.Handle)
+        if not child_list:
+            return []
+        layout = child_descriptor_slots(descriptor_container)
+        slots = [[] for _ in range(layout.slots_count)]
         for child in child_list:
-            child_tag, set_xsi = descriptor_container.tag_name_for_child_descriptor(child.NODETYPE)
-            self.make_descriptor_node(child, node, child_tag, set_xsi)
-        descriptor_container.sort_child_nodes(node)
-        return node
+            try:
+                slots[layout.slot_lookup[child.NODETYPE]].append(child)
+            except KeyError:
+                raise ValueError(f'{child.NODETYPE} not known in child declarations of '
+                                 f'{descriptor_container.__class__.__name__}') from None
+        own_nodes = node[:]
+        own_nodes_count = len(own_nodes)
+        index = 0
+        pending = []
+        for tag, slot_index, set_xsi in layout.element_slots:
+            while index < own_nodes_count and own_nodes[index].tag == tag:
+                index += 1
+            if slot_index is None:
+                continue
+            for child in slots[slot_index]:
+                child_node = self._mk_descriptor_element(child, node, tag, set_xsi)
+                if index < own_nodes_count:
+                    # move the still empty element to its position, this is cheaper than moving a subtree
+                    own_nodes[index].addprevious(child_node)
+                pending.append((child, child_node, set_xsi))
+        if index < own_nodes_count:
+            raise ValueError(f'{descriptor_container.__class__.__name__}: not in order: '
+                             f'{[n.tag for n in own_nodes[index:]]}, node={node.tag}')
+        return pending
 
     def _reconstruct_mdib(self, add_context_states: bool) -> xml_utils.LxmlElement:
         """Build dom tree of mdib from current data.
@@ -400,8 +459,8 @@ class MdibBase:
         mdib_node = etree_.Element(msg.Mdib, nsmap=doc_nsmap)
         mdib_node.set('MdibVersion', str(self.mdib_version))
         mdib_node.set('SequenceId', self.sequence_id)
-        md_description_node = self._reconstruct_md_description()
-        mdib_node.append(md_description_node)
+        # create all nodes as sub elements of mdib_node, this avoids moving them between documents
+        self._reconstruct_md_description(mdib_node)
 
         # add a list of states
         md_state_node = etree_.SubElement(mdib_node, pm.MdState,
@@ -409,10 +468,10 @@ class MdibBase:
                                           nsmap=doc_nsmap)
         tag = pm.State
         for state_container in self.states.objects:
-            md_state_node.append(state_container.mk_state_node(tag, self.nsmapper))
+            state_container.mk_state_node(tag, self.nsmapper, parent_node=md_state_node)
         if add_context_states:
             for state_container in self.context_states.objects:
-                md_state_node.append(state_container.mk_state_node(tag, self.nsmapper))
+                state_container.mk_state_node(tag, self.nsmapper, parent_node=md_state_node)
         return mdib_node
 
     def reconstruct_md_description(self) -> (xml_utils.LxmlElement, MdibVersionGroup):
@@ -442,7 +501,8 @@ class MdibBase:
         if len(descriptors) == 0:
             return []
         with_types = [d for d in descriptors if d.Type is not None]
-        return [d for d in with_types if have_matching_codes(d.Type, code)]
+        # the searched code is passed first, the codings of d.Type are then only created until one matches
+        return [d for d in with_types if have_matching_codes(code, d.Type)]
 
     def get_metric_descriptor_by_code(self,
                                       vmd_code: [Coding, CodedValue],
@@ -454,7 +514,7 @@ class MdibBase:
         """
         pm = self.data_model.pm_names
         all_vmds = self.descriptions.NODETYPE.get(pm.VmdDescriptor, [])
-        matching_vmd_list = [d for d in all_vmds if have_matching_codes(d.Type, vmd_code)]
+        matching_vmd_list = [d for d in all_vmds if have_matching_codes(vmd_code, d.Type)]
         for vmd in matching_vmd_list:
             matching_channels = self._get_child_descriptors_by_code(vmd.Handle, channel_code)
             for channel in matching_channels:
@@ -533,7 +593,7 @@ class MdibBase:
                     selected_objects.extend(self.descriptions.parent_handle.get(handle, []))
             # filter current list
             selected_objects = [o for o in selected_objects if
-                                o.Type is not None and have_matching_codes(o.Type, coding)]
+                                o.Type is not None and have_matching_codes(coding, o.Type)]
         return selected_objects
 
     def get_all_descriptors_in_subtree(self, root_descriptor_container: AbstractDescriptorContainer,
@@ -571,7 +631,6 @@ class MdibBase:
         for descriptor_container in descriptor_containers:
             self._logger.debug('rm Descriptor node {} handle {}', # noqa: PLE1205
                                descriptor_container.NODETYPE, descriptor_container.Handle)
-            self.descriptions.remove_object(descriptor_container)
             deleted_descriptors[descriptor_container.Handle] = descriptor_container
             for m_key in (self.states, self.context_states):
                 state_containers = m_key.descriptor_handle.get(descriptor_container.Handle)
@@ -582,6 +641,8 @@ class MdibBase:
                                        len(state_containers), descriptor_container.Handle)
                     m_key.remove_objects(state_containers)
                     deleted_states[descriptor_container.Handle] = state_containers
+        # remove all descriptors in one call, siblings share the same parent_handle list
+        self.descriptions.remove_objects(descriptor_containers)
 
         if deleted_descriptors:
             self.deleted_descriptors_by_handle = deleted_descriptors
@@ -14,6 +14,7 @@ from sdc11073.xml_types import xml_structure as x_struct
 from .containerbase import ContainerBase
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
     from decimal import Decimal
 
     from lxml.etree import QName
@@ -50,7 +51,7 @@ class AbstractStateProtocol(Protocol):
         ...
 
     def update_from_other_container(self, other: AbstractStateProtocol,
-                                    skipped_properties: list[str] | None = None):
+                                    skipped_properties: Collection[str] | None = None):
         """Copy all properties except the skipped ones to self."""
 
     def update_from_node(self, node: xml_utils.LxmlElement):
@@ -89,12 +90,16 @@ class AbstractStateContainer(ContainerBase):
 
     def mk_state_node(self, tag: QName,
                       nsmapper: NamespaceHelper,
-                      set_xsi_type: bool = True) -> xml_utils.LxmlElement:
-        """Create an etree node from instance data."""
-        return super().mk_node(tag, nsmapper, set_xsi_type=set_xsi_type)
+                      set_xsi_type: bool = True,
+                      parent_node: xml_utils.LxmlElement | None = None) -> xml_utils.LxmlElement:
+        """Create an etree node from instance data.
+
+        If parent_node is given, the node is created as last child of parent_node.
+        """
+        return super().mk_node(tag, nsmapper, parent_node=parent_node, set_xsi_type=set_xsi_type)
 
     def update_from_other_container(self, other: AbstractStateContainer,
-                                    skipped_properties: list[str] | None = None):
+                                    skipped_properties: Collection[str] | None = None):
         """Copy all properties except the skipped ones to self."""
         if other.DescriptorHandle != self.DescriptorHandle:
             raise ValueError(
@@ -565,7 +570,8 @@ class AbstractMultiStateContainer(AbstractStateContainer):
         super().__init__(descriptor_container)
         self.Handle = handle  # pylint: disable=invalid-name
 
-    def update_from_other_container(self, other: AbstractMultiStateContainer, skipped_properties: list[str] = None):
+    def update_from_other_container(self, other: AbstractMultiStateContainer,
+                                    skipped_properties: Collection[str] | None = None):
         """Copy all properties except the skipped ones to self.
 
         Accept node only if DescriptorHandle and Handle match.
@@ -575,11 +581,14 @@ class AbstractMultiStateContainer(AbstractStateContainer):
                 f'Update from a node with different handle is not possible! Have "{self.Handle}", got "{other.Handle}"')
         super().update_from_other_container(other, skipped_properties)
 
-    def mk_state_node(self, tag: QName, nsmapper: NamespaceHelper, set_xsi_type: bool = True) -> xml_utils.LxmlElement:
+    def mk_state_node(self, tag: QName,
+                      nsmapper: NamespaceHelper,
+                      set_xsi_type: bool = True,
+                      parent_node: xml_utils.LxmlElement | None = None) -> xml_utils.LxmlElement:
         """Create an etree node from instance data."""
         if self.Handle is None:
             self.Handle = uuid.uuid4().hex
-        return super().mk_state_node(tag, nsmapper, set_xsi_type)
+        return super().mk_state_node(tag, nsmapper, set_xsi_type, parent_node)
 
     def __repr__(self) -> str:
         return (f'{self.__class__.__name__} DescriptorHandle="{self.DescriptorHandle}" '
@@ -709,10 +718,10 @@ classes_with_nodetype = [c[1] for c in classes if hasattr(c[1], 'NODETYPE') and
 # make a dictionary from found classes: (Key is NODETYPE, value is the class itself
 _state_lookup_by_type = {c.NODETYPE: c for c in classes_with_nodetype}
 
+# same content, but keyed by the text of the QName, like the descriptor lookup in descriptorcontainers.
+# A QName finds the same entry, because its hash and equality are those of its text.
+_state_lookup_by_text = {sys.intern(k.text): v for k, v in _state_lookup_by_type.items()}
 
-def get_container_class(type_qname: QName) -> type[AbstractStateProtocol]:
-    """Return class for given type.
-
-    :param type_qname: the QName of the expected NODETYPE.
-    """
-    return _state_lookup_by_type.get(type_qname)
+# get_container_class(type_qname) returns the class for the QName of the expected NODETYPE (or its text), or None.
+# It is the bound get method of the lookup, which saves a python function call per state.
+get_container_class = _state_lookup_by_text.get
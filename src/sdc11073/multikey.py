@@ -83,6 +83,16 @@ class IndexDefinition(dict):
         except (KeyError, ValueError):
             pass
 
+    def rm_objects(self, key, object_ids):
+        """ removes all objects whose id is in object_ids from the list of key.
+        The list is filtered only once, which keeps bulk removal linear instead of quadratic."""
+        obj_list = self.get(key)
+        if obj_list is None:
+            return
+        obj_list[:] = [obj for obj in obj_list if id(obj) not in object_ids]
+        if len(obj_list) == 0:
+            del self[key]
+
 
 class UIndexDefinition(IndexDefinition):
     """ A unique Index, there can only be one object with that key"""
@@ -235,12 +245,18 @@ class MultiKeyLookup:
             self.remove_objects_no_lock(objects)
 
     def remove_objects_no_lock(self, objects):
+        # collect the ids of all removed objects per (index, key), then every list is filtered only once
+        removed_ids = {}
         for obj in objects:
-            obj_refs = self._object_ids.get(id(obj))
+            obj_refs = self._object_ids.pop(id(obj), None)
             if obj_refs is None:
                 continue
-            self._rm_indices(obj)
+            for obj_ref in obj_refs:
+                removed_ids.setdefault((id(obj_ref.index_dict), obj_ref.key),
+                                       (obj_ref, set()))[1].add(id(obj))
             self._objects.remove(obj)
+        for obj_ref, obj_ids in removed_ids.values():
+            obj_ref.index_dict.rm_objects(obj_ref.key, obj_ids)
 
     def update_object(self, obj):
         if obj not in self._objects:
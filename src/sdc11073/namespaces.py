@@ -1,6 +1,7 @@
 """ A helper for xml name space handling"""
 from __future__ import annotations
 
+import functools
 import pathlib
 from enum import Enum
 from typing import Optional, Type, NamedTuple
@@ -8,6 +9,16 @@ from typing import Optional, Type, NamedTuple
 from lxml import etree as etree_
 
 
+@functools.lru_cache(maxsize=None)
+def _qname(namespace: str, localname: str) -> etree_.QName:
+    """Return a canonical QName instance, the same instance is returned for the same name.
+
+    Only use it for names that are defined in code. Names that are read from received xml
+    (e.g. in text_to_qname) must not be cached here, the cache has no size limit.
+    """
+    return etree_.QName(namespace, localname)
+
+
 class PrefixNamespace(NamedTuple):
     prefix: str
     namespace: str
@@ -15,7 +26,7 @@ class PrefixNamespace(NamedTuple):
     local_schema_file: pathlib.Path | None
 
     def tag(self, localname: str) -> etree_.QName:
-        return etree_.QName(self.namespace, localname)
+        return _qname(self.namespace, localname)
 
     def doc_name(self, localname: str) -> str:
         if self.prefix:
@@ -245,7 +256,7 @@ def text_to_qname(text: str, doc_nsmap: dict) -> etree_.QName:
         raise KeyError(f'Cannot make QName for {text}, prefix is not in nsmap: {doc_nsmap.keys()}') from ex
 
 
-QN_TYPE = etree_.QName(PrefixesEnum.XSI.namespace, 'type')  # frequently used QName, central definition
+QN_TYPE = PrefixesEnum.XSI.tag('type')  # frequently used QName, central definition
 
 
 class EventingActions:
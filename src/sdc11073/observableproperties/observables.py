@@ -28,7 +28,6 @@ Example:
 
 """
 import contextlib
-import inspect
 import weakref
 from contextlib import contextmanager
 
@@ -37,6 +36,8 @@ class WeakRef:
     """ This Weak Ref implementation allows to hold references to bound methods.
     => see http://stackoverflow.com/questions/599430/why-doesnt-the-weakref-work-on-this-bound-method"""
 
+    __slots__ = ('reference', 'method', 'instance')
+
     def __init__(self, item):
         self.reference = None
         self.method = None
@@ -66,7 +67,10 @@ class WeakRef:
 
 
 class _ObservableValue:
-    """ Implements the basic mechanism for an observable value. """
+    """ Implements the basic mechanism for an observable value.
+    Every observed object has one instance per ObservableProperty, therefore it uses __slots__. """
+
+    __slots__ = ('value', '_fire_only_on_changed_value', '_observers')
 
     def __init__(self, value, fire_only_on_changed_value=True):
         self.value = value
@@ -166,10 +170,8 @@ class ObservableProperty:
 def _find_property(obj, name):
     """ Helper that looks in class hierarchy for matching member
     """
-    classes = inspect.getmro(
-        obj.__class__)  # getmro returns a tuple of class base classes, including class, in method resolution order
-
-    for cls in classes:  # find the first class that has the expected member
+    # __mro__ is a tuple of class base classes, including class, in method resolution order
+    for cls in obj.__class__.__mro__:  # find the first class that has the expected member
         try:
             return cls.__dict__[name]
         except KeyError:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import copy
-import threading
+import itertools
 import uuid
 from typing import TYPE_CHECKING, Any, Protocol
 from urllib.parse import SplitResult
@@ -185,8 +185,9 @@ class SdcProvider:
         self._msg_converter = MessageConverterMiddleware(
             self.msg_reader, self.msg_factory, self._logger, self._hosted_service_dispatcher)
 
-        self._transaction_id = 0  # central transaction number handling for all called operations.
-        self._transaction_id_lock = threading.Lock()
+        # central transaction number handling for all called operations.
+        # next() of itertools.count is atomic in CPython, no lock is needed.
+        self._transaction_ids = itertools.count(1)
 
         # these are initialized in _setup_components:
         self._subscriptions_managers = {}
@@ -204,9 +205,7 @@ class SdcProvider:
 
     def generate_transaction_id(self) -> int:
         """Return a new transaction id."""
-        with self._transaction_id_lock:
-            self._transaction_id += 1
-            return self._transaction_id
+        return next(self._transaction_ids)
 
     def _mk_soap_client(self, netloc: str, accepted_encodings: list[str]) -> Any:
         cls = self._components.soap_client_class
@@ -13,7 +13,6 @@ from __future__ import annotations
 
 import queue
 import threading
-import time
 import traceback
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
@@ -74,13 +73,11 @@ class _OperationsWorker(threading.Thread):
                         self._logger.info('stop request found. Terminating now.')
                         return
                     tr_id, operation, request, operation_request = from_queue  # unpack tuple
-                    time.sleep(0.001)
                     self._logger.info('%s: starting operation "%s" argument=%r',
                                       operation.__class__.__name__, operation.handle, operation_request.argument)
                     # duplicate the WAIT response to the operation request as notification. Standard requires this.
                     self._set_service.notify_operation(
                         operation, tr_id, InvocationState.WAIT, self._mdib.mdib_version_group)
-                    time.sleep(0.001)  # not really necessary, but in real world there might also be some delay.
                     self._set_service.notify_operation(
                         operation, tr_id, InvocationState.START, self._mdib.mdib_version_group)
                     try:
@@ -18,6 +18,14 @@ if TYPE_CHECKING:
 
     from .providerbase import OperationClassGetter
 
+# properties of a context state that a client can not change by an update via SetContextState
+_UPDATE_SKIPPED_PROPERTIES = frozenset(('ContextAssociation',
+                                        'BindingMdibVersion',
+                                        'UnbindingMdibVersion',
+                                        'BindingStartTime',
+                                        'BindingEndTime',
+                                        'StateVersion'))
+
 
 class GenericContextProvider(providerbase.ProviderRole):
     """Handles SetContextState operations."""
@@ -26,7 +34,8 @@ class GenericContextProvider(providerbase.ProviderRole):
                  op_target_descr_types: list[QName] | None = None,
                  log_prefix: str | None = None):
         super().__init__(mdib, log_prefix)
-        self._op_target_descr_types = op_target_descr_types
+        # a set, make_operation_instance checks every operation target type against it
+        self._op_target_descr_types = frozenset(op_target_descr_types or ())
 
     def make_operation_instance(self,
                                 operation_descriptor_container: AbstractOperationDescriptorProtocol,
@@ -35,12 +44,13 @@ class GenericContextProvider(providerbase.ProviderRole):
 
         Only if type of operation target matches opTargetDescriptorTypes.
         """
+        if not self._op_target_descr_types:
+            return None  # we do not handle any target type
         pm_names = self._mdib.data_model.pm_names
         if pm_names.SetContextStateOperationDescriptor == operation_descriptor_container.NODETYPE:
             op_target_descr_container = self._mdib.descriptions.handle.get_one(
                 operation_descriptor_container.OperationTarget)
-            if (not self._op_target_descr_types) or (
-                    op_target_descr_container.NODETYPE not in self._op_target_descr_types):
+            if op_target_descr_container.NODETYPE not in self._op_target_descr_types:
                 return None  # we do not handle this target type
             return self._mk_operation_from_operation_descriptor(operation_descriptor_container,
                                                                 operation_cls_getter,
@@ -50,9 +60,18 @@ class GenericContextProvider(providerbase.ProviderRole):
     def _set_context_state(self, params: ExecuteParameters) -> ExecuteResult:
         """Execute the operation itself (ExecuteHandler)."""
         proposed_context_states = params.operation_request.argument
+        invocation_state = self._mdib.data_model.msg_types.InvocationState
+        if not proposed_context_states:
+            # nothing to do, do not notify observers about an empty transaction
+            return ExecuteResult(params.operation_instance.operation_target_handle, invocation_state.FINISHED)
         pm_types = self._mdib.data_model.pm_types
         operation_target_handles = []
+        # descriptor handles whose associated context states are already disassociated in this transaction
+        unbound_descriptor_handles = set()
         with self._mdib.context_state_transaction() as mgr:
+            # all states that are bound or unbound by this operation get the same mdib version and time
+            mdib_version = self._mdib.mdib_version
+            now = time.time()
             for proposed_st in proposed_context_states:
                 old_state_container = None
                 if proposed_st.DescriptorHandle != proposed_st.Handle:
@@ -66,14 +85,19 @@ class GenericContextProvider(providerbase.ProviderRole):
                     # create a new unique handle
                     proposed_st.Handle = uuid.uuid4().hex
                     operation_target_handles.append(proposed_st.Handle)
-                    proposed_st.BindingMdibVersion = self._mdib.mdib_version
-                    proposed_st.BindingStartTime = time.time()
+                    proposed_st.BindingMdibVersion = mdib_version
+                    proposed_st.BindingStartTime = now
                     proposed_st.ContextAssociation = pm_types.ContextAssociation.ASSOCIATED
                     self._logger.info('new %s, DescriptorHandle=%s Handle=%s',
                                       proposed_st.NODETYPE.localname, proposed_st.DescriptorHandle, proposed_st.Handle)
                     mgr.add_state(proposed_st)
 
                     # find all associated context states, disassociate them, set unbinding info, and add them to updates
+                    # (only once per descriptor handle: the transaction already contains them for further new states,
+                    # and getting the same state from the transaction a second time raises a ValueError)
+                    if proposed_st.DescriptorHandle in unbound_descriptor_handles:
+                        continue
+                    unbound_descriptor_handles.add(proposed_st.DescriptorHandle)
                     old_state_containers = self._mdib.context_states.descriptor_handle.get(
                         proposed_st.DescriptorHandle, [])
                     for old_state in old_state_containers:
@@ -84,28 +108,21 @@ class GenericContextProvider(providerbase.ProviderRole):
                             new_state = mgr.get_context_state(old_state.Handle)
                             new_state.ContextAssociation = pm_types.ContextAssociation.DISASSOCIATED
                             if new_state.UnbindingMdibVersion is None:
-                                new_state.UnbindingMdibVersion = self._mdib.mdib_version
-                                new_state.BindingEndTime = time.time()
+                                new_state.UnbindingMdibVersion = mdib_version
+                                new_state.BindingEndTime = now
                             operation_target_handles.append(new_state.Handle)
                 else:
                     # this is an update to an existing patient
                     # use "regular" way to update via transaction manager
                     self._logger.info('update %s, handle=%s', proposed_st.NODETYPE.localname, proposed_st.Handle)
                     tmp = mgr.get_context_state(proposed_st.Handle)
-                    tmp.update_from_other_container(proposed_st, skipped_properties=['ContextAssociation',
-                                                                                     'BindingMdibVersion',
-                                                                                     'UnbindingMdibVersion',
-                                                                                     'BindingStartTime',
-                                                                                     'BindingEndTime',
-                                                                                     'StateVersion'])
+                    tmp.update_from_other_container(proposed_st, skipped_properties=_UPDATE_SKIPPED_PROPERTIES)
                     operation_target_handles.append(proposed_st.Handle)
             if len(operation_target_handles) == 1:
-                return ExecuteResult(operation_target_handles[0],
-                                     self._mdib.data_model.msg_types.InvocationState.FINISHED)
+                return ExecuteResult(operation_target_handles[0], invocation_state.FINISHED)
             # the operation manipulated more than one context state, but the operation can only return a single handle.
             # (that is a BICEPS shortcoming, the string return type only reflects that situation).
-            return ExecuteResult(params.operation_instance.operation_target_handle,
-                                 self._mdib.data_model.msg_types.InvocationState.FINISHED)
+            return ExecuteResult(params.operation_instance.operation_target_handle, invocation_state.FINISHED)
 
 
 class EnsembleContextProvider(GenericContextProvider):
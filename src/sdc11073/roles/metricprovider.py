@@ -122,6 +122,14 @@ class GenericMetricProvider(ProviderRole):
 
     def _set_numeric_value(self, params: ExecuteParameters) -> ExecuteResult:
         """Set a numerical metric value (ExecuteHandler)."""
+        return self._set_metric_value(params)
+
+    def _set_string(self, params: ExecuteParameters) -> ExecuteResult:
+        """Set a string value (ExecuteHandler)."""
+        return self._set_metric_value(params)
+
+    def _set_metric_value(self, params: ExecuteParameters) -> ExecuteResult:
+        """Set the MetricValue.Value of the operation target, common implementation of SetValue and SetString."""
         value = params.operation_request.argument
         pm_types = self._mdib.data_model.pm_types
         self._logger.info('set value of %s via %s from %r to %r',
@@ -141,22 +149,6 @@ class GenericMetricProvider(ProviderRole):
                 params.operation_instance.operation_target_handle)
             if metric_descriptor_container.MetricCategory in (pm_types.MetricCategory.SETTING,
                                                               pm_types.MetricCategory.PRESETTING):
-                state.MetricValue.Validity = pm_types.MeasurementValidity.VALID
-        return ExecuteResult(params.operation_instance.operation_target_handle,
-                             self._mdib.data_model.msg_types.InvocationState.FINISHED)
-
-    def _set_string(self, params: ExecuteParameters) -> ExecuteResult:
-        """Set a string value (ExecuteHandler)."""
-        value = params.operation_request.argument
-        self._logger.info('set value %s from %s to %s',
-                          params.operation_instance.operation_target_handle,
-                          params.operation_instance.current_value, value)
-        params.operation_instance.current_value = value
-        with self._mdib.metric_state_transaction() as mgr:
-            _state = mgr.get_state(params.operation_instance.operation_target_handle)
-            state = cast(MetricStateProtocol, _state)
-            if state.MetricValue is None:
-                state.mk_metric_value()
-            state.MetricValue.Value = value
+                state.MetricValue.MetricQuality.Validity = pm_types.MeasurementValidity.VALID
         return ExecuteResult(params.operation_instance.operation_target_handle,
                              self._mdib.data_model.msg_types.InvocationState.FINISHED)
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import enum
-import inspect
 import traceback
 from math import isclose
 from typing import TYPE_CHECKING
 
 from lxml import etree as etree_
 
-from .xml_structure import NodeStringProperty, NodeTextListProperty
+from .xml_structure import NodeStringProperty, NodeTextListProperty, collect_class_properties
 
 if TYPE_CHECKING:
     from sdc11073 import xml_utils
@@ -31,9 +30,22 @@ class XMLTypeBase:
     -
     """
 
+    _sorted_container_properties: tuple = ()  # calculated once per class in __init_subclass__
+    # bound methods of all properties in the same order, calling them directly avoids attribute lookups
+    _init_instance_data_methods: tuple = ()
+    _update_xml_value_methods: tuple = ()
+    _update_from_node_methods: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        (cls._sorted_container_properties,
+         cls._init_instance_data_methods,
+         cls._update_xml_value_methods,
+         cls._update_from_node_methods) = collect_class_properties(cls)
+
     def __init__(self):
-        for _, prop in self.sorted_container_properties():
-            prop.init_instance_data(self)
+        for init_instance_data in self._init_instance_data_methods:
+            init_instance_data(self)
 
     def as_etree_node(self, q_name: etree_.QName, ns_map: dict, parent_node: etree_.Element | None = None):
         if parent_node is not None:
@@ -44,40 +56,33 @@ class XMLTypeBase:
         return node
 
     def update_node(self, node: xml_utils.LxmlElement):
-        for prop_name, prop in self.sorted_container_properties():
-            try:
-                prop.update_xml_value(self, node)
-            except Exception as ex:
-                # re-raise with some information about the data
-                raise ValueError(
-                    f'In {self.__class__.__name__}.{prop_name}, {prop!s} could not update: {traceback.format_exc()}') from ex
+        try:
+            for update_xml_value in self._update_xml_value_methods:
+                update_xml_value(self, node)
+        except Exception as ex:
+            # re-raise with some information about the data
+            prop = update_xml_value.__self__
+            prop_name = next(name for name, obj in self._sorted_container_properties if obj is prop)
+            raise ValueError(
+                f'In {self.__class__.__name__}.{prop_name}, {prop!s} could not update: {traceback.format_exc()}') from ex
 
     def update_from_node(self, node: xml_utils.LxmlElement):
-        for dummy, prop in self.sorted_container_properties():
-            prop.update_from_node(self, node)
+        for update_from_node in self._update_from_node_methods:
+            update_from_node(self, node)
 
     def sorted_container_properties(self):
         """
-        @return: a list of (name, object) tuples of all GenericProperties ( and subclasses)
-        list is created based on _props lists of classes
+        @return: a tuple of (name, object) tuples of all GenericProperties ( and subclasses)
+        tuple is created based on _props lists of classes
         """
-        ret = []
-        classes = inspect.getmro(self.__class__)
-        for cls in reversed(classes):
-            try:
-                names = cls.__dict__['_props']  # this checks only current class, not parent
-            except (AttributeError, KeyError):
-                continue
-            for name in names:
-                obj = getattr(cls, name)
-                if obj is not None:
-                    ret.append((name, obj))
-        return ret
+        return self._sorted_container_properties
 
     def __eq__(self, other):
         """ compares all properties"""
+        if other is self:
+            return True
         try:
-            for name, dummy in self.sorted_container_properties():
+            for name, _ in self._sorted_container_properties:
                 my_value = getattr(self, name)
                 other_value = getattr(other, name)
                 if my_value == other_value:
@@ -93,7 +98,7 @@ class XMLTypeBase:
         return not self == other
 
     def __repr__(self):
-        return f'{self.__class__.__name__}({self.sorted_container_properties()})'
+        return f'{self.__class__.__name__}({list(self.sorted_container_properties())})'
 
     @classmethod
     def from_node(cls, node):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from decimal import Decimal
 from typing import Protocol, Any
 
@@ -61,13 +62,22 @@ class EnumConverter(NullConverter):
 
     def __init__(self, klass):
         self._klass = klass
+        # value => member lookup of the enum class, probing it directly avoids the slow call of the enum class
+        self._value2member_map = getattr(klass, '_value2member_map_', {})
+        # member => value lookup, avoids the slow value property of enum members
+        self._member2value_map = {member: member.value for member in getattr(klass, '__members__', {}).values()}
 
     def to_py(self, xml_value):
-        value = self._klass(xml_value)
-        return value
+        try:
+            return self._value2member_map[xml_value]
+        except (KeyError, TypeError):
+            return self._klass(xml_value)  # handles aliases, _missing_ and errors
 
     def to_xml(self, py_value):
-        return py_value.value if hasattr(py_value, 'value') else py_value
+        try:
+            return self._member2value_map[py_value]
+        except (KeyError, TypeError):
+            return py_value.value if hasattr(py_value, 'value') else py_value
 
     def check_valid(self, py_value) -> bool:
         if STRICT_VALUE_CHECK and py_value is not None:
@@ -89,6 +99,17 @@ class StringConverter(NullConverter):
                 raise ValueError(f'Value can only be str, got {type(py_value)}')
 
 
+class InternedStringConverter(StringConverter):
+    """Like StringConverter, but strings read from xml are interned.
+
+    Used for values that are repeated in documents and that are used as keys, e.g. handles.
+    """
+
+    @staticmethod
+    def to_py(xml_value):
+        return sys.intern(xml_value or '')
+
+
 class ListConverter(NullConverter):
     """Each element in list is checked and converted with provided element_converter."""
 
@@ -156,6 +177,13 @@ class DecimalConverter(NullConverter):
             return float(xml_value)
         return int(xml_value)
 
+    @classmethod
+    def list_to_py(cls, xml_values: list[str]) -> list[Decimal | int | float]:
+        """Convert many values at once, e.g. the Samples of a SampleArrayValue."""
+        if cls.USE_DECIMAL_TYPE:
+            return list(map(Decimal, xml_values))  # no python call per value
+        return [cls.to_py(xml_value) for xml_value in xml_values]
+
     @staticmethod
     def _float_to_xml(py_value: Decimal | int | float) -> str:
         # round value to handle float inaccuracies
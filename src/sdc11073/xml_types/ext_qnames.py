@@ -1,5 +1,7 @@
 # generated by "generate_qnames"
 from sdc11073.namespaces import default_ns_helper
 
-Extension = default_ns_helper.EXT.tag('Extension')
-ExtensionType = default_ns_helper.EXT.tag('ExtensionType')
+_tag = default_ns_helper.EXT.tag
+
+Extension = _tag('Extension')
+ExtensionType = _tag('ExtensionType')
@@ -186,10 +186,9 @@ def _mk_tz_string(date_object: DateTypeUnion) -> str:
 
 def date_time_string(date_object: DateTypeUnion) -> str:
     if hasattr(date_object, 'hour'):  # datetime object
-        date_string = '{:4d}-{:02d}-{:02d}T{:02d}:{:02d}:{}{}'.format(
-            date_object.year, date_object.month, date_object.day,
-            date_object.hour, date_object.minute,
-            _mk_seconds_string(date_object), _mk_tz_string(date_object))
+        date_string = (f'{date_object.year:4d}-{date_object.month:02d}-{date_object.day:02d}'
+                       f'T{date_object.hour:02d}:{date_object.minute:02d}:'
+                       f'{_mk_seconds_string(date_object)}{_mk_tz_string(date_object)}')
     elif hasattr(date_object, 'day'):  # date object
         date_string = f'{date_object.year:4d}-{date_object.month:02d}-{date_object.day:02d}'
     elif hasattr(date_object, 'month'):  # GYearMonth object
@@ -563,7 +563,7 @@ class GetContextStatesByIdentification(AbstractGet):
     action = Actions.GetContextStatesByIdentification
     Identification = cp.SubElementListProperty(msg.Identification, value_class=InstanceIdentifier)
     ContextType = cp.QNameAttributeProperty('ContextType')
-    _props = ('HandleRef',)
+    _props = ('Identification', 'ContextType')
 
 
 class GetContextStatesByIdentificationResponse(AbstractGetResponse):
@@ -581,7 +581,7 @@ class GetContextStatesByFilter(AbstractGet):
     NODETYPE = msg.GetContextStatesByFilter
     action = Actions.GetContextStatesByFilter
     Filter = cp.SubElementStringListProperty(msg.Filter)
-    _props = ('HandleRef',)
+    _props = ('Filter',)
 
 
 class GetContextStatesByFilterResponse(AbstractGetResponse):
@@ -1,245 +1,247 @@
 # generated by "generate_qnames"
 from sdc11073.namespaces import default_ns_helper
 
-AbstractAlertDescriptor = default_ns_helper.PM.tag('AbstractAlertDescriptor')
-AbstractAlertState = default_ns_helper.PM.tag('AbstractAlertState')
-AbstractComplexDeviceComponentDescriptor = default_ns_helper.PM.tag('AbstractComplexDeviceComponentDescriptor')
-AbstractComplexDeviceComponentState = default_ns_helper.PM.tag('AbstractComplexDeviceComponentState')
-AbstractContextDescriptor = default_ns_helper.PM.tag('AbstractContextDescriptor')
-AbstractContextState = default_ns_helper.PM.tag('AbstractContextState')
-AbstractDescriptor = default_ns_helper.PM.tag('AbstractDescriptor')
-AbstractDeviceComponentDescriptor = default_ns_helper.PM.tag('AbstractDeviceComponentDescriptor')
-AbstractDeviceComponentState = default_ns_helper.PM.tag('AbstractDeviceComponentState')
-AbstractMetricDescriptor = default_ns_helper.PM.tag('AbstractMetricDescriptor')
-AbstractMetricState = default_ns_helper.PM.tag('AbstractMetricState')
-AbstractMetricValue = default_ns_helper.PM.tag('AbstractMetricValue')
-AbstractMultiState = default_ns_helper.PM.tag('AbstractMultiState')
-AbstractOperationDescriptor = default_ns_helper.PM.tag('AbstractOperationDescriptor')
-AbstractOperationState = default_ns_helper.PM.tag('AbstractOperationState')
-AbstractSetStateOperationDescriptor = default_ns_helper.PM.tag('AbstractSetStateOperationDescriptor')
-AbstractState = default_ns_helper.PM.tag('AbstractState')
-AccessionIdentifier = default_ns_helper.PM.tag('AccessionIdentifier')
-ActivateOperationDescriptor = default_ns_helper.PM.tag('ActivateOperationDescriptor')
-ActivateOperationState = default_ns_helper.PM.tag('ActivateOperationState')
-ActiveSyncProtocol = default_ns_helper.PM.tag('ActiveSyncProtocol')
-AlertCondition = default_ns_helper.PM.tag('AlertCondition')
-AlertConditionDescriptor = default_ns_helper.PM.tag('AlertConditionDescriptor')
-AlertConditionState = default_ns_helper.PM.tag('AlertConditionState')
-AlertSignal = default_ns_helper.PM.tag('AlertSignal')
-AlertSignalDescriptor = default_ns_helper.PM.tag('AlertSignalDescriptor')
-AlertSignalState = default_ns_helper.PM.tag('AlertSignalState')
-AlertSystem = default_ns_helper.PM.tag('AlertSystem')
-AlertSystemDescriptor = default_ns_helper.PM.tag('AlertSystemDescriptor')
-AlertSystemState = default_ns_helper.PM.tag('AlertSystemState')
-AllowedRange = default_ns_helper.PM.tag('AllowedRange')
-AllowedValue = default_ns_helper.PM.tag('AllowedValue')
-AllowedValues = default_ns_helper.PM.tag('AllowedValues')
-Annotation = default_ns_helper.PM.tag('Annotation')
-ApplyAnnotation = default_ns_helper.PM.tag('ApplyAnnotation')
-ApprovedJurisdiction = default_ns_helper.PM.tag('ApprovedJurisdiction')
-ApprovedJurisdictions = default_ns_helper.PM.tag('ApprovedJurisdictions')
-Arg = default_ns_helper.PM.tag('Arg')
-ArgName = default_ns_helper.PM.tag('ArgName')
-Argument = default_ns_helper.PM.tag('Argument')
-AssignedLocation = default_ns_helper.PM.tag('AssignedLocation')
-BaseDemographics = default_ns_helper.PM.tag('BaseDemographics')
-Battery = default_ns_helper.PM.tag('Battery')
-BatteryDescriptor = default_ns_helper.PM.tag('BatteryDescriptor')
-BatteryState = default_ns_helper.PM.tag('BatteryState')
-BirthLength = default_ns_helper.PM.tag('BirthLength')
-BirthWeight = default_ns_helper.PM.tag('BirthWeight')
-Birthname = default_ns_helper.PM.tag('Birthname')
-BodySite = default_ns_helper.PM.tag('BodySite')
-CalibrationDocumentation = default_ns_helper.PM.tag('CalibrationDocumentation')
-CalibrationInfo = default_ns_helper.PM.tag('CalibrationInfo')
-CalibrationResult = default_ns_helper.PM.tag('CalibrationResult')
-CapacityFullCharge = default_ns_helper.PM.tag('CapacityFullCharge')
-CapacityRemaining = default_ns_helper.PM.tag('CapacityRemaining')
-CapacitySpecified = default_ns_helper.PM.tag('CapacitySpecified')
-Category = default_ns_helper.PM.tag('Category')
-CauseInfo = default_ns_helper.PM.tag('CauseInfo')
-Channel = default_ns_helper.PM.tag('Channel')
-ChannelDescriptor = default_ns_helper.PM.tag('ChannelDescriptor')
-ChannelState = default_ns_helper.PM.tag('ChannelState')
-Characteristic = default_ns_helper.PM.tag('Characteristic')
-ClinicalInfo = default_ns_helper.PM.tag('ClinicalInfo')
-Clock = default_ns_helper.PM.tag('Clock')
-ClockDescriptor = default_ns_helper.PM.tag('ClockDescriptor')
-ClockState = default_ns_helper.PM.tag('ClockState')
-Code = default_ns_helper.PM.tag('Code')
-CodedValue = default_ns_helper.PM.tag('CodedValue')
-CodingSystemName = default_ns_helper.PM.tag('CodingSystemName')
-ComponentId = default_ns_helper.PM.tag('ComponentId')
-ConceptDescription = default_ns_helper.PM.tag('ConceptDescription')
-ContainmentTree = default_ns_helper.PM.tag('ContainmentTree')
-ContainmentTreeEntry = default_ns_helper.PM.tag('ContainmentTreeEntry')
-CoreData = default_ns_helper.PM.tag('CoreData')
-Criticality = default_ns_helper.PM.tag('Criticality')
-Current = default_ns_helper.PM.tag('Current')
-DangerCode = default_ns_helper.PM.tag('DangerCode')
-DateOfBirth = default_ns_helper.PM.tag('DateOfBirth')
-Description = default_ns_helper.PM.tag('Description')
-DeviceIdentifier = default_ns_helper.PM.tag('DeviceIdentifier')
-DistributionRange = default_ns_helper.PM.tag('DistributionRange')
-DistributionSampleArrayMetricDescriptor = default_ns_helper.PM.tag('DistributionSampleArrayMetricDescriptor')
-DistributionSampleArrayMetricState = default_ns_helper.PM.tag('DistributionSampleArrayMetricState')
-Documentation = default_ns_helper.PM.tag('Documentation')
-DomainUnit = default_ns_helper.PM.tag('DomainUnit')
-End = default_ns_helper.PM.tag('End')
-EnsembleContext = default_ns_helper.PM.tag('EnsembleContext')
-EnsembleContextDescriptor = default_ns_helper.PM.tag('EnsembleContextDescriptor')
-EnsembleContextState = default_ns_helper.PM.tag('EnsembleContextState')
-Entry = default_ns_helper.PM.tag('Entry')
-EnumStringMetricDescriptor = default_ns_helper.PM.tag('EnumStringMetricDescriptor')
-EnumStringMetricState = default_ns_helper.PM.tag('EnumStringMetricState')
-ExpirationDate = default_ns_helper.PM.tag('ExpirationDate')
-Familyname = default_ns_helper.PM.tag('Familyname')
-FillerOrderNumber = default_ns_helper.PM.tag('FillerOrderNumber')
-GestationalAge = default_ns_helper.PM.tag('GestationalAge')
-Givenname = default_ns_helper.PM.tag('Givenname')
-HeadCircumference = default_ns_helper.PM.tag('HeadCircumference')
-Height = default_ns_helper.PM.tag('Height')
-HumanReadableForm = default_ns_helper.PM.tag('HumanReadableForm')
-Identification = default_ns_helper.PM.tag('Identification')
-IdentifierName = default_ns_helper.PM.tag('IdentifierName')
-ImagingProcedure = default_ns_helper.PM.tag('ImagingProcedure')
-InstanceIdentifier = default_ns_helper.PM.tag('InstanceIdentifier')
-Issuer = default_ns_helper.PM.tag('Issuer')
-Jurisdiction = default_ns_helper.PM.tag('Jurisdiction')
-Label = default_ns_helper.PM.tag('Label')
-LimitAlertConditionDescriptor = default_ns_helper.PM.tag('LimitAlertConditionDescriptor')
-LimitAlertConditionState = default_ns_helper.PM.tag('LimitAlertConditionState')
-Limits = default_ns_helper.PM.tag('Limits')
-LocalizedText = default_ns_helper.PM.tag('LocalizedText')
-LocationContext = default_ns_helper.PM.tag('LocationContext')
-LocationContextDescriptor = default_ns_helper.PM.tag('LocationContextDescriptor')
-LocationContextState = default_ns_helper.PM.tag('LocationContextState')
-LocationDetail = default_ns_helper.PM.tag('LocationDetail')
-LocationReference = default_ns_helper.PM.tag('LocationReference')
-LotNumber = default_ns_helper.PM.tag('LotNumber')
-ManufactureDate = default_ns_helper.PM.tag('ManufactureDate')
-Manufacturer = default_ns_helper.PM.tag('Manufacturer')
-MaxLimits = default_ns_helper.PM.tag('MaxLimits')
-MdDescription = default_ns_helper.PM.tag('MdDescription')
-MdState = default_ns_helper.PM.tag('MdState')
-Mdib = default_ns_helper.PM.tag('Mdib')
-Mds = default_ns_helper.PM.tag('Mds')
-MdsDescriptor = default_ns_helper.PM.tag('MdsDescriptor')
-MdsState = default_ns_helper.PM.tag('MdsState')
-Meaning = default_ns_helper.PM.tag('Meaning')
-MeansContext = default_ns_helper.PM.tag('MeansContext')
-MeansContextDescriptor = default_ns_helper.PM.tag('MeansContextDescriptor')
-MeansContextState = default_ns_helper.PM.tag('MeansContextState')
-Measurement = default_ns_helper.PM.tag('Measurement')
-MeasurementUnit = default_ns_helper.PM.tag('MeasurementUnit')
-MetaData = default_ns_helper.PM.tag('MetaData')
-Metric = default_ns_helper.PM.tag('Metric')
-MetricQuality = default_ns_helper.PM.tag('MetricQuality')
-MetricValue = default_ns_helper.PM.tag('MetricValue')
-Middlename = default_ns_helper.PM.tag('Middlename')
-Modality = default_ns_helper.PM.tag('Modality')
-ModelName = default_ns_helper.PM.tag('ModelName')
-ModelNumber = default_ns_helper.PM.tag('ModelNumber')
-ModifiableData = default_ns_helper.PM.tag('ModifiableData')
-Mother = default_ns_helper.PM.tag('Mother')
-Name = default_ns_helper.PM.tag('Name')
-NeonatalPatientDemographicsCoreData = default_ns_helper.PM.tag('NeonatalPatientDemographicsCoreData')
-NextCalibration = default_ns_helper.PM.tag('NextCalibration')
-NumericMetricDescriptor = default_ns_helper.PM.tag('NumericMetricDescriptor')
-NumericMetricState = default_ns_helper.PM.tag('NumericMetricState')
-NumericMetricValue = default_ns_helper.PM.tag('NumericMetricValue')
-OperatingJurisdiction = default_ns_helper.PM.tag('OperatingJurisdiction')
-Operation = default_ns_helper.PM.tag('Operation')
-OperationGroup = default_ns_helper.PM.tag('OperationGroup')
-OperatorContext = default_ns_helper.PM.tag('OperatorContext')
-OperatorContextDescriptor = default_ns_helper.PM.tag('OperatorContextDescriptor')
-OperatorContextState = default_ns_helper.PM.tag('OperatorContextState')
-OperatorDetails = default_ns_helper.PM.tag('OperatorDetails')
-OrderDetail = default_ns_helper.PM.tag('OrderDetail')
-Patient = default_ns_helper.PM.tag('Patient')
-PatientContext = default_ns_helper.PM.tag('PatientContext')
-PatientContextDescriptor = default_ns_helper.PM.tag('PatientContextDescriptor')
-PatientContextState = default_ns_helper.PM.tag('PatientContextState')
-PatientDemographicsCoreData = default_ns_helper.PM.tag('PatientDemographicsCoreData')
-PatientType = default_ns_helper.PM.tag('PatientType')
-PerformedOrderDetail = default_ns_helper.PM.tag('PerformedOrderDetail')
-Performer = default_ns_helper.PM.tag('Performer')
-PersonParticipation = default_ns_helper.PM.tag('PersonParticipation')
-PersonReference = default_ns_helper.PM.tag('PersonReference')
-PhysicalConnector = default_ns_helper.PM.tag('PhysicalConnector')
-PhysicalConnectorInfo = default_ns_helper.PM.tag('PhysicalConnectorInfo')
-PhysiologicalRange = default_ns_helper.PM.tag('PhysiologicalRange')
-PlacerOrderNumber = default_ns_helper.PM.tag('PlacerOrderNumber')
-ProductionSpec = default_ns_helper.PM.tag('ProductionSpec')
-ProductionSpecification = default_ns_helper.PM.tag('ProductionSpecification')
-ProtocolCode = default_ns_helper.PM.tag('ProtocolCode')
-Race = default_ns_helper.PM.tag('Race')
-Range = default_ns_helper.PM.tag('Range')
-RealTimeSampleArrayMetricDescriptor = default_ns_helper.PM.tag('RealTimeSampleArrayMetricDescriptor')
-RealTimeSampleArrayMetricState = default_ns_helper.PM.tag('RealTimeSampleArrayMetricState')
-ReferenceRange = default_ns_helper.PM.tag('ReferenceRange')
-ReferenceSource = default_ns_helper.PM.tag('ReferenceSource')
-ReferringPhysician = default_ns_helper.PM.tag('ReferringPhysician')
-RelatedMeasurement = default_ns_helper.PM.tag('RelatedMeasurement')
-Relation = default_ns_helper.PM.tag('Relation')
-RelevantClinicalInfo = default_ns_helper.PM.tag('RelevantClinicalInfo')
-RemainingBatteryTime = default_ns_helper.PM.tag('RemainingBatteryTime')
-RemedyInfo = default_ns_helper.PM.tag('RemedyInfo')
-RequestedOrderDetail = default_ns_helper.PM.tag('RequestedOrderDetail')
-RequestedProcedureId = default_ns_helper.PM.tag('RequestedProcedureId')
-RequestingPhysician = default_ns_helper.PM.tag('RequestingPhysician')
-ResultingClinicalInfo = default_ns_helper.PM.tag('ResultingClinicalInfo')
-Role = default_ns_helper.PM.tag('Role')
-SampleArrayValue = default_ns_helper.PM.tag('SampleArrayValue')
-ScheduledProcedureStepId = default_ns_helper.PM.tag('ScheduledProcedureStepId')
-Sco = default_ns_helper.PM.tag('Sco')
-ScoDescriptor = default_ns_helper.PM.tag('ScoDescriptor')
-ScoState = default_ns_helper.PM.tag('ScoState')
-SerialNumber = default_ns_helper.PM.tag('SerialNumber')
-Service = default_ns_helper.PM.tag('Service')
-SetAlertStateOperationDescriptor = default_ns_helper.PM.tag('SetAlertStateOperationDescriptor')
-SetAlertStateOperationState = default_ns_helper.PM.tag('SetAlertStateOperationState')
-SetComponentStateOperationDescriptor = default_ns_helper.PM.tag('SetComponentStateOperationDescriptor')
-SetComponentStateOperationState = default_ns_helper.PM.tag('SetComponentStateOperationState')
-SetContextStateOperationDescriptor = default_ns_helper.PM.tag('SetContextStateOperationDescriptor')
-SetContextStateOperationState = default_ns_helper.PM.tag('SetContextStateOperationState')
-SetMetricStateOperationDescriptor = default_ns_helper.PM.tag('SetMetricStateOperationDescriptor')
-SetMetricStateOperationState = default_ns_helper.PM.tag('SetMetricStateOperationState')
-SetStringOperationDescriptor = default_ns_helper.PM.tag('SetStringOperationDescriptor')
-SetStringOperationState = default_ns_helper.PM.tag('SetStringOperationState')
-SetValueOperationDescriptor = default_ns_helper.PM.tag('SetValueOperationDescriptor')
-SetValueOperationState = default_ns_helper.PM.tag('SetValueOperationState')
-Sex = default_ns_helper.PM.tag('Sex')
-Source = default_ns_helper.PM.tag('Source')
-SpecType = default_ns_helper.PM.tag('SpecType')
-Start = default_ns_helper.PM.tag('Start')
-State = default_ns_helper.PM.tag('State')
-StringMetricDescriptor = default_ns_helper.PM.tag('StringMetricDescriptor')
-StringMetricState = default_ns_helper.PM.tag('StringMetricState')
-StringMetricValue = default_ns_helper.PM.tag('StringMetricValue')
-StudyInstanceUid = default_ns_helper.PM.tag('StudyInstanceUid')
-SystemContext = default_ns_helper.PM.tag('SystemContext')
-SystemContextDescriptor = default_ns_helper.PM.tag('SystemContextDescriptor')
-SystemContextState = default_ns_helper.PM.tag('SystemContextState')
-SystemSignalActivation = default_ns_helper.PM.tag('SystemSignalActivation')
-TechnicalRange = default_ns_helper.PM.tag('TechnicalRange')
-Temperature = default_ns_helper.PM.tag('Temperature')
-TimeProtocol = default_ns_helper.PM.tag('TimeProtocol')
-Title = default_ns_helper.PM.tag('Title')
-Translation = default_ns_helper.PM.tag('Translation')
-Type = default_ns_helper.PM.tag('Type')
-Udi = default_ns_helper.PM.tag('Udi')
-Unit = default_ns_helper.PM.tag('Unit')
-Validator = default_ns_helper.PM.tag('Validator')
-Value = default_ns_helper.PM.tag('Value')
-VisitNumber = default_ns_helper.PM.tag('VisitNumber')
-Vmd = default_ns_helper.PM.tag('Vmd')
-VmdDescriptor = default_ns_helper.PM.tag('VmdDescriptor')
-VmdState = default_ns_helper.PM.tag('VmdState')
-Voltage = default_ns_helper.PM.tag('Voltage')
-VoltageSpecified = default_ns_helper.PM.tag('VoltageSpecified')
-Weight = default_ns_helper.PM.tag('Weight')
-WorkflowContext = default_ns_helper.PM.tag('WorkflowContext')
-WorkflowContextDescriptor = default_ns_helper.PM.tag('WorkflowContextDescriptor')
-WorkflowContextState = default_ns_helper.PM.tag('WorkflowContextState')
-WorkflowDetail = default_ns_helper.PM.tag('WorkflowDetail')
+_tag = default_ns_helper.PM.tag
+
+AbstractAlertDescriptor = _tag('AbstractAlertDescriptor')
+AbstractAlertState = _tag('AbstractAlertState')
+AbstractComplexDeviceComponentDescriptor = _tag('AbstractComplexDeviceComponentDescriptor')
+AbstractComplexDeviceComponentState = _tag('AbstractComplexDeviceComponentState')
+AbstractContextDescriptor = _tag('AbstractContextDescriptor')
+AbstractContextState = _tag('AbstractContextState')
+AbstractDescriptor = _tag('AbstractDescriptor')
+AbstractDeviceComponentDescriptor = _tag('AbstractDeviceComponentDescriptor')
+AbstractDeviceComponentState = _tag('AbstractDeviceComponentState')
+AbstractMetricDescriptor = _tag('AbstractMetricDescriptor')
+AbstractMetricState = _tag('AbstractMetricState')
+AbstractMetricValue = _tag('AbstractMetricValue')
+AbstractMultiState = _tag('AbstractMultiState')
+AbstractOperationDescriptor = _tag('AbstractOperationDescriptor')
+AbstractOperationState = _tag('AbstractOperationState')
+AbstractSetStateOperationDescriptor = _tag('AbstractSetStateOperationDescriptor')
+AbstractState = _tag('AbstractState')
+AccessionIdentifier = _tag('AccessionIdentifier')
+ActivateOperationDescriptor = _tag('ActivateOperationDescriptor')
+ActivateOperationState = _tag('ActivateOperationState')
+ActiveSyncProtocol = _tag('ActiveSyncProtocol')
+AlertCondition = _tag('AlertCondition')
+AlertConditionDescriptor = _tag('AlertConditionDescriptor')
+AlertConditionState = _tag('AlertConditionState')
+AlertSignal = _tag('AlertSignal')
+AlertSignalDescriptor = _tag('AlertSignalDescriptor')
+AlertSignalState = _tag('AlertSignalState')
+AlertSystem = _tag('AlertSystem')
+AlertSystemDescriptor = _tag('AlertSystemDescriptor')
+AlertSystemState = _tag('AlertSystemState')
+AllowedRange = _tag('AllowedRange')
+AllowedValue = _tag('AllowedValue')
+AllowedValues = _tag('AllowedValues')
+Annotation = _tag('Annotation')
+ApplyAnnotation = _tag('ApplyAnnotation')
+ApprovedJurisdiction = _tag('ApprovedJurisdiction')
+ApprovedJurisdictions = _tag('ApprovedJurisdictions')
+Arg = _tag('Arg')
+ArgName = _tag('ArgName')
+Argument = _tag('Argument')
+AssignedLocation = _tag('AssignedLocation')
+BaseDemographics = _tag('BaseDemographics')
+Battery = _tag('Battery')
+BatteryDescriptor = _tag('BatteryDescriptor')
+BatteryState = _tag('BatteryState')
+BirthLength = _tag('BirthLength')
+BirthWeight = _tag('BirthWeight')
+Birthname = _tag('Birthname')
+BodySite = _tag('BodySite')
+CalibrationDocumentation = _tag('CalibrationDocumentation')
+CalibrationInfo = _tag('CalibrationInfo')
+CalibrationResult = _tag('CalibrationResult')
+CapacityFullCharge = _tag('CapacityFullCharge')
+CapacityRemaining = _tag('CapacityRemaining')
+CapacitySpecified = _tag('CapacitySpecified')
+Category = _tag('Category')
+CauseInfo = _tag('CauseInfo')
+Channel = _tag('Channel')
+ChannelDescriptor = _tag('ChannelDescriptor')
+ChannelState = _tag('ChannelState')
+Characteristic = _tag('Characteristic')
+ClinicalInfo = _tag('ClinicalInfo')
+Clock = _tag('Clock')
+ClockDescriptor = _tag('ClockDescriptor')
+ClockState = _tag('ClockState')
+Code = _tag('Code')
+CodedValue = _tag('CodedValue')
+CodingSystemName = _tag('CodingSystemName')
+ComponentId = _tag('ComponentId')
+ConceptDescription = _tag('ConceptDescription')
+ContainmentTree = _tag('ContainmentTree')
+ContainmentTreeEntry = _tag('ContainmentTreeEntry')
+CoreData = _tag('CoreData')
+Criticality = _tag('Criticality')
+Current = _tag('Current')
+DangerCode = _tag('DangerCode')
+DateOfBirth = _tag('DateOfBirth')
+Description = _tag('Description')
+DeviceIdentifier = _tag('DeviceIdentifier')
+DistributionRange = _tag('DistributionRange')
+DistributionSampleArrayMetricDescriptor = _tag('DistributionSampleArrayMetricDescriptor')
+DistributionSampleArrayMetricState = _tag('DistributionSampleArrayMetricState')
+Documentation = _tag('Documentation')
+DomainUnit = _tag('DomainUnit')
+End = _tag('End')
+EnsembleContext = _tag('EnsembleContext')
+EnsembleContextDescriptor = _tag('EnsembleContextDescriptor')
+EnsembleContextState = _tag('EnsembleContextState')
+Entry = _tag('Entry')
+EnumStringMetricDescriptor = _tag('EnumStringMetricDescriptor')
+EnumStringMetricState = _tag('EnumStringMetricState')
+ExpirationDate = _tag('ExpirationDate')
+Familyname = _tag('Familyname')
+FillerOrderNumber = _tag('FillerOrderNumber')
+GestationalAge = _tag('GestationalAge')
+Givenname = _tag('Givenname')
+HeadCircumference = _tag('HeadCircumference')
+Height = _tag('Height')
+HumanReadableForm = _tag('HumanReadableForm')
+Identification = _tag('Identification')
+IdentifierName = _tag('IdentifierName')
+ImagingProcedure = _tag('ImagingProcedure')
+InstanceIdentifier = _tag('InstanceIdentifier')
+Issuer = _tag('Issuer')
+Jurisdiction = _tag('Jurisdiction')
+Label = _tag('Label')
+LimitAlertConditionDescriptor = _tag('LimitAlertConditionDescriptor')
+LimitAlertConditionState = _tag('LimitAlertConditionState')
+Limits = _tag('Limits')
+LocalizedText = _tag('LocalizedText')
+LocationContext = _tag('LocationContext')
+LocationContextDescriptor = _tag('LocationContextDescriptor')
+LocationContextState = _tag('LocationContextState')
+LocationDetail = _tag('LocationDetail')
+LocationReference = _tag('LocationReference')
+LotNumber = _tag('LotNumber')
+ManufactureDate = _tag('ManufactureDate')
+Manufacturer = _tag('Manufacturer')
+MaxLimits = _tag('MaxLimits')
+MdDescription = _tag('MdDescription')
+MdState = _tag('MdState')
+Mdib = _tag('Mdib')
+Mds = _tag('Mds')
+MdsDescriptor = _tag('MdsDescriptor')
+MdsState = _tag('MdsState')
+Meaning = _tag('Meaning')
+MeansContext = _tag('MeansContext')
+MeansContextDescriptor = _tag('MeansContextDescriptor')
+MeansContextState = _tag('MeansContextState')
+Measurement = _tag('Measurement')
+MeasurementUnit = _tag('MeasurementUnit')
+MetaData = _tag('MetaData')
+Metric = _tag('Metric')
+MetricQuality = _tag('MetricQuality')
+MetricValue = _tag('MetricValue')
+Middlename = _tag('Middlename')
+Modality = _tag('Modality')
+ModelName = _tag('ModelName')
+ModelNumber = _tag('ModelNumber')
+ModifiableData = _tag('ModifiableData')
+Mother = _tag('Mother')
+Name = _tag('Name')
+NeonatalPatientDemographicsCoreData = _tag('NeonatalPatientDemographicsCoreData')
+NextCalibration = _tag('NextCalibration')
+NumericMetricDescriptor = _tag('NumericMetricDescriptor')
+NumericMetricState = _tag('NumericMetricState')
+NumericMetricValue = _tag('NumericMetricValue')
+OperatingJurisdiction = _tag('OperatingJurisdiction')
+Operation = _tag('Operation')
+OperationGroup = _tag('OperationGroup')
+OperatorContext = _tag('OperatorContext')
+OperatorContextDescriptor = _tag('OperatorContextDescriptor')
+OperatorContextState = _tag('OperatorContextState')
+OperatorDetails = _tag('OperatorDetails')
+OrderDetail = _tag('OrderDetail')
+Patient = _tag('Patient')
+PatientContext = _tag('PatientContext')
+PatientContextDescriptor = _tag('PatientContextDescriptor')
+PatientContextState = _tag('PatientContextState')
+PatientDemographicsCoreData = _tag('PatientDemographicsCoreData')
+PatientType = _tag('PatientType')
+PerformedOrderDetail = _tag('PerformedOrderDetail')
+Performer = _tag('Performer')
+PersonParticipation = _tag('PersonParticipation')
+PersonReference = _tag('PersonReference')
+PhysicalConnector = _tag('PhysicalConnector')
+PhysicalConnectorInfo = _tag('PhysicalConnectorInfo')
+PhysiologicalRange = _tag('PhysiologicalRange')
+PlacerOrderNumber = _tag('PlacerOrderNumber')
+ProductionSpec = _tag('ProductionSpec')
+ProductionSpecification = _tag('ProductionSpecification')
+ProtocolCode = _tag('ProtocolCode')
+Race = _tag('Race')
+Range = _tag('Range')
+RealTimeSampleArrayMetricDescriptor = _tag('RealTimeSampleArrayMetricDescriptor')
+RealTimeSampleArrayMetricState = _tag('RealTimeSampleArrayMetricState')
+ReferenceRange = _tag('ReferenceRange')
+ReferenceSource = _tag('ReferenceSource')
+ReferringPhysician = _tag('ReferringPhysician')
+RelatedMeasurement = _tag('RelatedMeasurement')
+Relation = _tag('Relation')
+RelevantClinicalInfo = _tag('RelevantClinicalInfo')
+RemainingBatteryTime = _tag('RemainingBatteryTime')
+RemedyInfo = _tag('RemedyInfo')
+RequestedOrderDetail = _tag('RequestedOrderDetail')
+RequestedProcedureId = _tag('RequestedProcedureId')
+RequestingPhysician = _tag('RequestingPhysician')
+ResultingClinicalInfo = _tag('ResultingClinicalInfo')
+Role = _tag('Role')
+SampleArrayValue = _tag('SampleArrayValue')
+ScheduledProcedureStepId = _tag('ScheduledProcedureStepId')
+Sco = _tag('Sco')
+ScoDescriptor = _tag('ScoDescriptor')
+ScoState = _tag('ScoState')
+SerialNumber = _tag('SerialNumber')
+Service = _tag('Service')
+SetAlertStateOperationDescriptor = _tag('SetAlertStateOperationDescriptor')
+SetAlertStateOperationState = _tag('SetAlertStateOperationState')
+SetComponentStateOperationDescriptor = _tag('SetComponentStateOperationDescriptor')
+SetComponentStateOperationState = _tag('SetComponentStateOperationState')
+SetContextStateOperationDescriptor = _tag('SetContextStateOperationDescriptor')
+SetContextStateOperationState = _tag('SetContextStateOperationState')
+SetMetricStateOperationDescriptor = _tag('SetMetricStateOperationDescriptor')
+SetMetricStateOperationState = _tag('SetMetricStateOperationState')
+SetStringOperationDescriptor = _tag('SetStringOperationDescriptor')
+SetStringOperationState = _tag('SetStringOperationState')
+SetValueOperationDescriptor = _tag('SetValueOperationDescriptor')
+SetValueOperationState = _tag('SetValueOperationState')
+Sex = _tag('Sex')
+Source = _tag('Source')
+SpecType = _tag('SpecType')
+Start = _tag('Start')
+State = _tag('State')
+StringMetricDescriptor = _tag('StringMetricDescriptor')
+StringMetricState = _tag('StringMetricState')
+StringMetricValue = _tag('StringMetricValue')
+StudyInstanceUid = _tag('StudyInstanceUid')
+SystemContext = _tag('SystemContext')
+SystemContextDescriptor = _tag('SystemContextDescriptor')
+SystemContextState = _tag('SystemContextState')
+SystemSignalActivation = _tag('SystemSignalActivation')
+TechnicalRange = _tag('TechnicalRange')
+Temperature = _tag('Temperature')
+TimeProtocol = _tag('TimeProtocol')
+Title = _tag('Title')
+Translation = _tag('Translation')
+Type = _tag('Type')
+Udi = _tag('Udi')
+Unit = _tag('Unit')
+Validator = _tag('Validator')
+Value = _tag('Value')
+VisitNumber = _tag('VisitNumber')
+Vmd = _tag('Vmd')
+VmdDescriptor = _tag('VmdDescriptor')
+VmdState = _tag('VmdState')
+Voltage = _tag('Voltage')
+VoltageSpecified = _tag('VoltageSpecified')
+Weight = _tag('Weight')
+WorkflowContext = _tag('WorkflowContext')
+WorkflowContextDescriptor = _tag('WorkflowContextDescriptor')
+WorkflowContextState = _tag('WorkflowContextState')
+WorkflowDetail = _tag('WorkflowDetail')
@@ -16,6 +16,8 @@ from . import xml_structure as cp
 from .basetypes import StringEnum, XMLTypeBase
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from lxml.etree import QName
     from sdc11073 import xml_utils
 
@@ -293,6 +295,17 @@ class PropertyBasedPMType(XMLTypeBase):
         xsi_type = text_to_qname(xsi_type_str, node.nsmap)
         return _get_pmtypes_class(xsi_type)
 
+    @classmethod
+    def _from_node_without_init(cls, node: xml_utils.LxmlElement) -> PropertyBasedPMType:
+        """Construct class from a node without calling __init__ of cls.
+
+        update_from_node sets all members, no need to run __init__ with its argument handling first.
+        """
+        obj = cls.__new__(cls)
+        XMLTypeBase.__init__(obj)
+        obj.update_from_node(node)
+        return obj
+
 
 class LocalizedText(PropertyBasedPMType):
     """Represents BICEPS LocalizedText."""
@@ -320,9 +333,7 @@ class LocalizedText(PropertyBasedPMType):
     @classmethod
     def from_node(cls, node: xml_utils.LxmlElement) -> LocalizedText:
         """Construct class from a node."""
-        obj = cls('')
-        obj.update_from_node(node)
-        return obj
+        return cls._from_node_without_init(node)
 
     def __repr__(self) -> str:
         params = [f'"{self.text}"']
@@ -339,8 +350,11 @@ class LocalizedText(PropertyBasedPMType):
 
 DEFAULT_CODING_SYSTEM = 'urn:oid:1.2.840.10004.1.1.1.0.0.1'  # ISO/IEC 11073-10101
 
+# slots of dataclasses are supported since python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Coding:
     """Coding contains the three Values that identify a CodedValue.
 
@@ -401,9 +415,7 @@ class Translation(PropertyBasedPMType):
     @classmethod
     def from_node(cls, node: xml_utils.LxmlElement) -> Translation:
         """Construct class from a node."""
-        obj = cls('')
-        obj.update_from_node(node)
-        return obj
+        return cls._from_node_without_init(node)
 
 
 TranslationType = Translation  # TypeAlias
@@ -438,8 +450,11 @@ class CodedValue(PropertyBasedPMType):
         self.Code = code
         self.CodingSystem = coding_system
         self.CodingSystemVersion = coding_system_version
-        self.CodingSystemName = [] if coding_system_names is None else coding_system_names
-        self.ConceptDescription = [] if concept_descriptions is None else concept_descriptions
+        # the lists are already initialized empty, only replace them if values are given
+        if coding_system_names is not None:
+            self.CodingSystemName = coding_system_names
+        if concept_descriptions is not None:
+            self.ConceptDescription = concept_descriptions
         self.SymbolicCodeName = symbolic_code_name
 
     @property
@@ -485,23 +500,27 @@ class CodedValue(PropertyBasedPMType):
     @classmethod
     def from_node(cls, node: xml_utils.LxmlElement) -> CodedValue:
         """Construct class from a node."""
-        obj = cls('')
-        obj.update_from_node(node)
-        return obj
+        return cls._from_node_without_init(node)
+
+
+def _iter_codings(code: CodedValue | Coding) -> Iterator[Coding]:
+    """Yield the Coding of code first, then the Codings of its Translations."""
+    try:
+        yield code.coding
+    except AttributeError:  # a Coding
+        yield code
+        return
+    translations = getattr(code, 'Translation', None)
+    if translations:
+        for translation in translations:
+            yield translation.coding
 
 
 def have_matching_codes(code_a: CodedValue | Coding, code_b: CodedValue | Coding) -> bool:
     """Test if there is at least one common Coding in code_a and code_b."""
-    try:
-        codes_a = set(code_a.all_codings)
-    except AttributeError:
-        codes_a = {code_a}
-    try:
-        codes_b = set(code_b.all_codings)
-    except AttributeError:
-        codes_b = {code_b}
-    common_codes = codes_a.intersection(codes_b)
-    return len(common_codes) > 0
+    codes_a = list(_iter_codings(code_a))
+    # codings of code_b are created one by one, in most cases the first one (the code itself) already matches
+    return any(coding in codes_a for coding in _iter_codings(code_b))
 
 
 class Annotation(PropertyBasedPMType):
@@ -558,7 +577,8 @@ class InstanceIdentifier(PropertyBasedPMType):
         super().__init__()
         self.Root = root
         self.Type = type_coded_value
-        self.IdentifierName = [] if identifier_names is None else identifier_names
+        if identifier_names is not None:  # else keep the initial empty list
+            self.IdentifierName = identifier_names
         self.Extension = extension_string
         self.node = None
 
@@ -629,9 +649,7 @@ class Measurement(PropertyBasedPMType):
     @classmethod
     def from_node(cls, node: xml_utils.LxmlElement) -> Measurement:
         """Construct class from a node."""
-        obj = cls(None, None)
-        obj.update_from_node(node)
-        return obj
+        return cls._from_node_without_init(node)
 
     def __repr__(self) -> str:
         return f'Measurement(value={self.MeasuredValue!r}, Unit={self.MeasurementUnit!r})'
@@ -783,7 +801,8 @@ class CauseInfo(PropertyBasedPMType):
                  descriptions: list[LocalizedText] | None = None):
         super().__init__()
         self.RemedyInfo = remedy_info
-        self.Description = descriptions or []
+        if descriptions:  # else keep the initial empty list
+            self.Description = descriptions
 
 
 class ActivateOperationDescriptorArgument(PropertyBasedPMType):
@@ -819,7 +838,8 @@ class PhysicalConnectorInfo(PropertyBasedPMType):
     def __init__(self, labels: list[LocalizedText] | None = None,
                  number: int | None = None):
         super().__init__()
-        self.Label = labels or []
+        if labels:  # else keep the initial empty list
+            self.Label = labels
         self.Number = number
 
     def __repr__(self) -> str:
@@ -844,6 +864,11 @@ class SystemSignalActivation(PropertyBasedPMType):
         self.Manifestation = manifestation
         self.State = state
 
+    @classmethod
+    def from_node(cls, node: xml_utils.LxmlElement) -> SystemSignalActivation:
+        """Construct class from a node."""
+        return cls._from_node_without_init(node)
+
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}(Manifestation={self.Manifestation}, State={self.State})'
 
@@ -866,6 +891,11 @@ class ProductionSpecification(PropertyBasedPMType):
         self.ProductionSpec = production_spec
         self.ComponentId = component_id
 
+    @classmethod
+    def from_node(cls, node: xml_utils.LxmlElement) -> ProductionSpecification:
+        """Construct class from a node."""
+        return cls._from_node_without_init(node)
+
 
 class BaseDemographics(PropertyBasedPMType):
     """Represents BICEPS BaseDemographics."""
@@ -887,7 +917,8 @@ class BaseDemographics(PropertyBasedPMType):
                  title: str | None = None):
         super().__init__()
         self.Givenname = given_name
-        self.Middlename = middle_names or []
+        if middle_names:  # else keep the initial empty list
+            self.Middlename = middle_names
         self.Familyname = family_name
         self.Birthname = birth_name
         self.Title = title
@@ -948,12 +979,18 @@ class LocationDetail(PropertyBasedPMType):
                  building: str | None = None,
                  floor: str | None = None):
         super().__init__()
-        self.PoC = poc
-        self.Room = room
-        self.Bed = bed
-        self.Facility = facility
-        self.Building = building
-        self.Floor = floor
+        if poc is not None:
+            self.PoC = poc
+        if room is not None:
+            self.Room = room
+        if bed is not None:
+            self.Bed = bed
+        if facility is not None:
+            self.Facility = facility
+        if building is not None:
+            self.Building = building
+        if floor is not None:
+            self.Floor = floor
 
 
 LocationDetailType = LocationDetail  # TypeAlias
@@ -1077,12 +1114,23 @@ class ImagingProcedure(PropertyBasedPMType):
                  modality: InstanceIdentifier | None = None,
                  protocol_code: CodedValue | None = None):
         super().__init__()
-        self.AccessionIdentifier = accession_identifier
-        self.RequestedProcedureId = requested_procedure_id
-        self.StudyInstanceUid = study_instance_uid
-        self.ScheduledProcedureStepId = scheduled_procedure_step_id
-        self.Modality = modality
-        self.ProtocolCode = protocol_code
+        if accession_identifier is not None:
+            self.AccessionIdentifier = accession_identifier
+        if requested_procedure_id is not None:
+            self.RequestedProcedureId = requested_procedure_id
+        if study_instance_uid is not None:
+            self.StudyInstanceUid = study_instance_uid
+        if scheduled_procedure_step_id is not None:
+            self.ScheduledProcedureStepId = scheduled_procedure_step_id
+        if modality is not None:
+            self.Modality = modality
+        if protocol_code is not None:
+            self.ProtocolCode = protocol_code
+
+    @classmethod
+    def from_node(cls, node: xml_utils.LxmlElement) -> ImagingProcedure:
+        """Construct class from a node."""
+        return cls._from_node_without_init(node)
 
 
 ImagingProcedureType = ImagingProcedure  # TypeAlias
@@ -1107,8 +1155,10 @@ class OrderDetail(PropertyBasedPMType):
                  service: list[CodedValue] | None = None,
                  imaging_procedure: list[ImagingProcedureType] | None = None):
         super().__init__()
-        self.Start = start
-        self.End = end
+        if start is not None:
+            self.Start = start
+        if end is not None:
+            self.End = end
         if performer:
             self.Performer = performer
         if service:
@@ -1140,9 +1190,12 @@ class RequestedOrderDetail(OrderDetail):
                  requesting_physician: PersonReference | None = None,
                  placer_order_number: InstanceIdentifier | None = None):
         super().__init__(start, end, performer, service, imaging_procedure)
-        self.ReferringPhysician = referring_physician
-        self.RequestingPhysician = requesting_physician
-        self.PlacerOrderNumber = placer_order_number
+        if referring_physician is not None:
+            self.ReferringPhysician = referring_physician
+        if requesting_physician is not None:
+            self.RequestingPhysician = requesting_physician
+        if placer_order_number is not None:
+            self.PlacerOrderNumber = placer_order_number
 
 
 RequestedOrderDetailType = RequestedOrderDetail  # TypeAlias
@@ -1168,7 +1221,8 @@ class PerformedOrderDetail(OrderDetail):
                  filler_order_number: InstanceIdentifier | None = None,
                  resulting_clinical_info: ClinicalInfoType | None = None):
         super().__init__(start, end, performer, service, imaging_procedure)
-        self.FillerOrderNumber = filler_order_number
+        if filler_order_number is not None:
+            self.FillerOrderNumber = filler_order_number
         if resulting_clinical_info:
             self.ResultingClinicalInfo = resulting_clinical_info
 
@@ -1207,15 +1261,20 @@ class WorkflowDetail(PropertyBasedPMType):
                  requested_order_detail: RequestedOrderDetailType | None = None,
                  performed_order_detail: PerformedOrderDetailType | None = None):
         super().__init__()
-        self.Patient = patient
-        self.AssignedLocation = assigned_location
-        self.VisitNumber = visit_number
+        if patient is not None:
+            self.Patient = patient
+        if assigned_location is not None:
+            self.AssignedLocation = assigned_location
+        if visit_number is not None:
+            self.VisitNumber = visit_number
         if danger_code:
             self.DangerCode = danger_code
         if relevant_clinical_info:
             self.RelevantClinicalInfo = relevant_clinical_info
-        self.RequestedOrderDetail = requested_order_detail
-        self.PerformedOrderDetail = performed_order_detail
+        if requested_order_detail is not None:
+            self.RequestedOrderDetail = requested_order_detail
+        if performed_order_detail is not None:
+            self.PerformedOrderDetail = performed_order_detail
 
 
 class Relation(PropertyBasedPMType):
@@ -1293,10 +1352,14 @@ class Udi(PropertyBasedPMType):
                  issuer: InstanceIdentifier | None = None,
                  jurisdiction: InstanceIdentifier | None = None):
         super().__init__()
-        self.DeviceIdentifier = device_identifier
-        self.HumanReadableForm = human_readable_form
-        self.Issuer = issuer
-        self.Jurisdiction = jurisdiction
+        if device_identifier is not None:
+            self.DeviceIdentifier = device_identifier
+        if human_readable_form is not None:
+            self.HumanReadableForm = human_readable_form
+        if issuer is not None:
+            self.Issuer = issuer
+        if jurisdiction is not None:
+            self.Jurisdiction = jurisdiction
 
 
 UdiType = Udi  # TypeAlias
@@ -1405,9 +1468,7 @@ class RetrievabilityInfo(PropertyBasedPMType):
     @classmethod
     def from_node(cls, node: xml_utils.LxmlElement) -> RetrievabilityInfo:
         """Construct class from a node."""
-        obj = cls(RetrievabilityMethod.GET)  # any allowed value, will be overwritten in update_node
-        obj.update_from_node(node)
-        return obj
+        return cls._from_node_without_init(node)
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__} {self.Method} period={self.UpdatePeriod}'
@@ -1431,14 +1492,18 @@ classes = inspect.getmembers(sys.modules[__name__],
                              lambda member: inspect.isclass(member) and member.__module__ == __name__)
 
 # make a dictionary from found classes: (Key is NODETYPE, value is the class itself
-_classes = [c[1] for c in classes if hasattr(c[1], 'NODETYPE') and c[1].NODETYPE is not None]
+# type aliases like ImagingProcedureType are found a second time, dict.fromkeys removes these duplicates
+_classes = list(dict.fromkeys(c[1] for c in classes if hasattr(c[1], 'NODETYPE') and c[1].NODETYPE is not None))
 
 _name_class_lookup = {c.NODETYPE: c for c in _classes}
+# same content, but keyed by the text of the QName. A QName hashes and compares like its text,
+# therefore this dictionary can be used with QNames as keys, too.
+_name_class_lookup_by_text = {sys.intern(k.text): v for k, v in _name_class_lookup.items()}
 
 
 def _get_pmtypes_class(qname: QName) -> type[PropertyBasedPMType]:
     """Find class in _name_class_lookup."""
-    try:
-        return _name_class_lookup[qname]
-    except KeyError as ex:
-        raise KeyError(f'{qname.namespace}.{qname.localname}') from ex
+    cls = _name_class_lookup_by_text.get(qname)
+    if cls is None:
+        raise KeyError(f'{qname.namespace}.{qname.localname}')
+    return cls
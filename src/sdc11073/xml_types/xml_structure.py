@@ -9,6 +9,7 @@ Container properties represent values in xml nodes.
 from __future__ import annotations
 
 import copy
+import functools
 import time
 from abc import ABC, abstractmethod
 from datetime import date, datetime
@@ -27,6 +28,7 @@ from .dataconverters import (
     DurationConverter,
     EnumConverter,
     IntegerConverter,
+    InternedStringConverter,
     ListConverter,
     NullConverter,
     StringConverter,
@@ -62,6 +64,29 @@ class _NumberStack:
         return str(cls._value)
 
 
+def collect_class_properties(cls: type) -> tuple[tuple[tuple[str, _XmlStructureBaseProperty], ...],
+                                                   tuple[Callable, ...], tuple[Callable, ...], tuple[Callable, ...]]:
+    """Collect the properties that are listed in the _props members of cls and its base classes.
+
+    Properties are sorted from the root class to the most derived class, as required by the xml schema.
+    :return: tuple of the (name, property) pairs and of the init_instance_data, update_xml_value
+             and update_from_node methods of these properties in the same order.
+    """
+    ret = []
+    for base_cls in reversed(cls.__mro__):
+        names = base_cls.__dict__.get('_props')  # this checks only current class, not parent
+        if names is None:
+            continue
+        for name in names:
+            obj = getattr(base_cls, name)
+            if obj is not None:
+                ret.append((name, obj))
+    return (tuple(ret),
+            tuple(prop.init_instance_data for _, prop in ret),
+            tuple(prop.update_xml_value for _, prop in ret),
+            tuple(prop.update_from_node for _, prop in ret))
+
+
 class _XmlStructureBaseProperty(ABC):
     """_XmlStructureBaseProperty defines a python property that converts between Python Data Types and XML data types.
 
@@ -275,7 +300,8 @@ class _ElementBase(_XmlStructureBaseProperty, ABC):
                                    create_missing_nodes: bool) -> xml_utils.LxmlElement:
         if sub_element_name is None:
             return node
-        sub_node = node.find(sub_element_name)
+        # iterchildren only looks at direct children like find does, but it does not parse a path expression
+        sub_node = next(node.iterchildren(sub_element_name), None)
         if sub_node is None:
             if not create_missing_nodes:
                 raise ElementNotFoundError(f'Element {sub_element_name} not found in {node.tag}')
@@ -296,10 +322,12 @@ class _ElementBase(_XmlStructureBaseProperty, ABC):
 class StringAttributeProperty(_AttributeBase):
     """Python representation is a string."""
 
+    _string_converter = StringConverter
+
     def __init__(self, attribute_name: str,
                  default_py_value: Any = None,
                  implied_py_value: Any = None, is_optional: bool = True):
-        super().__init__(attribute_name, StringConverter, default_py_value, implied_py_value, is_optional)
+        super().__init__(attribute_name, self._string_converter, default_py_value, implied_py_value, is_optional)
 
 
 class AnyURIAttributeProperty(StringAttributeProperty):
@@ -313,10 +341,15 @@ class CodeIdentifierAttributeProperty(StringAttributeProperty):
 class HandleAttributeProperty(StringAttributeProperty):
     """Represents a Handle attribute."""
 
+    # handles are keys of the mdib lookups and are repeated in states and references, interning shares the strings
+    _string_converter = InternedStringConverter
+
 
 class HandleRefAttributeProperty(StringAttributeProperty):
     """Represents a HandleRef attribute."""
 
+    _string_converter = InternedStringConverter
+
 
 class SymbolicCodeNameAttributeProperty(StringAttributeProperty):
     """Represents a SymbolicCodeName attribute."""
@@ -590,6 +623,14 @@ class DecimalListAttributeProperty(_AttributeListBase):
     def __init__(self, attribute_name: str):
         super().__init__(attribute_name, ListConverter(DecimalConverter))
 
+    def get_py_value_from_node(self, instance: Any,  # noqa: ARG002
+                               node: xml_utils.LxmlElement | None) -> list[Decimal | int | float]:
+        xml_value = None if node is None else node.attrib.get(self._attribute_name)
+        if xml_value is not None:
+            # this list can be long (Samples of a SampleArrayValue), therefore convert all values in one call
+            return DecimalConverter.list_to_py(xml_value.split())
+        return []
+
 
 class NodeTextProperty(_ElementBase):
     """Represents the text of an XML Element.
@@ -986,9 +1027,10 @@ class SubElementProperty(_ElementBase):
             if not self.is_optional:
                 if MANDATORY_VALUE_CHECKING and not self.is_optional:
                     raise ValueError(f'mandatory value {self._sub_element_name} missing')
-                etree_.SubElement(node, self._sub_element_name, nsmap=node.nsmap)
+                etree_.SubElement(node, self._sub_element_name)
         else:
-            sub_node = py_value.as_etree_node(self._sub_element_name, node.nsmap, node)
+            # no ns_map needed, all namespaces of node are in scope. Passing node.nsmap is expensive.
+            sub_node = py_value.as_etree_node(self._sub_element_name, None, node)
             if hasattr(py_value, 'NODETYPE') and hasattr(self.value_class, 'NODETYPE') \
                     and py_value.NODETYPE != self.value_class.NODETYPE:
                 # set xsi type
@@ -1043,7 +1085,7 @@ class ContainerProperty(_ElementBase):
             if not self.is_optional:
                 if MANDATORY_VALUE_CHECKING and not self.is_optional:
                     raise ValueError(f'mandatory value {self._sub_element_name} missing')
-                etree_.SubElement(node, self._sub_element_name, nsmap=node.nsmap)
+                etree_.SubElement(node, self._sub_element_name)
         else:
             self.remove_sub_element(node)
             sub_node = py_value.mk_node(self._sub_element_name, self._ns_helper, node)
@@ -1088,7 +1130,7 @@ class SubElementListProperty(_ElementListProperty):
         """Read value from node."""
         objects = []
         try:
-            nodes = node.findall(self._sub_element_name)
+            nodes = node.iterchildren(self._sub_element_name)
             for _node in nodes:
                 value_class = self.value_class.value_class_from_node(_node)
                 value = value_class.from_node(_node)
@@ -1106,7 +1148,8 @@ class SubElementListProperty(_ElementListProperty):
 
         if py_value is not None:
             for val in py_value:
-                sub_node = val.as_etree_node(self._sub_element_name, node.nsmap, node)
+                # no ns_map needed, all namespaces of node are in scope. Passing node.nsmap is expensive.
+                sub_node = val.as_etree_node(self._sub_element_name, None, node)
                 if hasattr(val, 'NODETYPE') and hasattr(self.value_class, 'NODETYPE') \
                         and val.NODETYPE != self.value_class.NODETYPE:
                     # set xsi type
@@ -1144,7 +1187,7 @@ class ContainerListProperty(_ElementListProperty):
         """Read value from node."""
         objects = []
         try:
-            nodes = node.findall(self._sub_element_name)
+            nodes = node.iterchildren(self._sub_element_name)
             for _node in nodes:
                 node_type_str = _node.get(QN_TYPE)
                 if node_type_str is not None:
@@ -1195,7 +1238,7 @@ class SubElementTextListProperty(_ElementListProperty):
         """Read value from node."""
         objects = []
         try:
-            nodes = node.findall(self._sub_element_name)
+            nodes = node.iterchildren(self._sub_element_name)
             for _node in nodes:
                 objects.append(_node.text)
             return objects
@@ -1267,7 +1310,7 @@ class SubElementWithSubElementListProperty(SubElementProperty):
         if py_value is None or py_value.is_empty():
             return
         self.remove_sub_element(node)
-        py_value.as_etree_node(self._sub_element_name, node.nsmap, node)  # creates a sub-node
+        py_value.as_etree_node(self._sub_element_name, None, node)  # creates a sub-node, namespaces are in scope
 
     def __set__(self, instance: Any, py_value: Any):
         if isinstance(py_value, self.value_class):
@@ -1414,6 +1457,15 @@ class NodeTextQNameListProperty(_ElementListProperty):
             sub_node.text = ' '.join(tmp)
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_date_of_birth(date_string: str) -> isoduration.DateTypeUnion | None:
+    """Parse isoduration string, cached because the same patient context is reported again and again.
+
+    All possible results (date, datetime, GYear and GYearMonth) are immutable, therefore they can be shared.
+    """
+    return isoduration.parse_date_time(date_string)
+
+
 class DateOfBirthProperty(_ElementBase):
     """DateOfBirthProperty represents the DateOfBirth type of BICEPS.
 
@@ -1449,7 +1501,7 @@ class DateOfBirthProperty(_ElementBase):
             sub_node = self._get_element_by_child_name(node, self._sub_element_name, create_missing_nodes=False)
             if sub_node is not None:
                 date_string = sub_node.text
-                return isoduration.parse_date_time(date_string)
+                return _parse_date_of_birth(date_string)
         except ElementNotFoundError:
             pass
         return None
@@ -1472,7 +1524,7 @@ class DateOfBirthProperty(_ElementBase):
     @staticmethod
     def mk_value_object(date_string: str) -> isoduration.DateTypeUnion | None:
         """Parse isoduration string."""
-        return isoduration.parse_date_time(date_string)
+        return _parse_date_of_birth(date_string)
 
     @staticmethod
     def _mk_datestring(date_object: date | datetime | isoduration.GYear | isoduration.GYearMonth | None) -> str:
@@ -110,6 +110,7 @@ class TestContainerProperties(unittest.TestCase):
     def test_DateOfBirthRegEx(self):
         result = DoB.mk_value_object('2003-06-30')
         self.assertEqual(result, datetime.date(2003, 6, 30))
+        self.assertIs(DoB.mk_value_object('2003-06-30'), result)  # parsed values are cached
 
         for text in ('foo', '0000-06-30', '01-00-01', '01-01-00'):  # several invalid strings
             result = DoB.mk_value_object(text)
@@ -234,6 +235,9 @@ class TestContainerProperties(unittest.TestCase):
             self.assertEqual(dummy.enum_prop, value)
             node = dummy.mk_node()
             self.assertEqual(node.attrib['enum_prop'], value.value)
+            self.assertIs(Dummy.enum_prop.get_py_value_from_node(dummy, node), value)
+        node.set('enum_prop', 'invalid')
+        self.assertRaises(ValueError, Dummy.enum_prop.get_py_value_from_node, dummy, node)
 
     def test_NodeAttributeListPropertyBase(self):
         dummy = Dummy()
@@ -264,6 +268,12 @@ class TestContainerProperties(unittest.TestCase):
         node = dummy.mk_node()
         self.assertEqual(node.attrib['dec_list_attr'], '1.11 0.99')
 
+        node.set('dec_list_attr', '1.11  0.99 42 ')
+        self.assertEqual(Dummy.dec_list_attr.get_py_value_from_node(dummy, node),
+                         [Decimal('1.11'), Decimal('.99'), Decimal('42')])
+        del node.attrib['dec_list_attr']
+        self.assertEqual(Dummy.dec_list_attr.get_py_value_from_node(dummy, node), [])
+
         for value in (1, 2, ['42', 43], 42.42, True, b'hello'):
             try:
                 dummy.dec_list_attr = value
@@ -4,6 +4,8 @@ from lxml import etree as etree_
 
 from sdc11073.namespaces import default_ns_helper as ns_hlp
 from sdc11073.xml_types import pm_types, msg_qnames as msg
+from sdc11073.xml_types import ext_qnames as ext
+from sdc11073.xml_types import pm_qnames as pm
 from sdc11073.mdib import descriptorcontainers
 from tests.mockstuff import dec_list
 test_tag = ns_hlp.PM.tag('MyDescriptor')
@@ -206,3 +208,67 @@ class TestDescriptorContainers(unittest.TestCase):
         dc2.update_from_other_container(dc)
         self.assertEqual(dc.TimeProtocol, dc2.TimeProtocol)
         self.assertEqual(dc.Resolution, dc2.Resolution)
+
+    def test_sorted_child_data(self):
+        dc = descriptorcontainers.MdsDescriptorContainer(handle='123', parent_handle=None)
+        q_names = descriptorcontainers.sorted_child_data(dc, '_child_elements_order')
+        # base class members come first
+        self.assertEqual(q_names[:3], (ext.Extension, pm.Type, pm.ProductionSpecification))
+        self.assertEqual(q_names[-1], pm.Vmd)
+        # result only depends on class, not on instance
+        dc2 = descriptorcontainers.MdsDescriptorContainer(handle='456', parent_handle=None)
+        self.assertIs(q_names, descriptorcontainers.sorted_child_data(dc2, '_child_elements_order'))
+
+    def test_tag_name_for_child_descriptor(self):
+        dc = descriptorcontainers.ChannelDescriptorContainer(handle='123', parent_handle='456')
+        self.assertEqual(dc.tag_name_for_child_descriptor(pm.NumericMetricDescriptor), (pm.Metric, True))
+        dc = descriptorcontainers.MdsDescriptorContainer(handle='123', parent_handle=None)
+        self.assertEqual(dc.tag_name_for_child_descriptor(pm.VmdDescriptor), (pm.Vmd, False))
+        # mapping of base class
+        self.assertEqual(dc.tag_name_for_child_descriptor(pm.ScoDescriptor), (pm.Sco, False))
+        self.assertRaises(ValueError, dc.tag_name_for_child_descriptor, pm.ChannelDescriptor)
+
+    def test_child_descriptor_slots(self):
+        dc = descriptorcontainers.MdsDescriptorContainer(handle='123', parent_handle=None)
+        layout = descriptorcontainers.child_descriptor_slots(dc)
+        q_names = descriptorcontainers.sorted_child_data(dc, '_child_elements_order')
+        self.assertEqual(tuple(e[0] for e in layout.element_slots), tuple(q.text for q in q_names))
+        # AlertSystem, Sco, SystemContext, Clock, Battery, Vmd
+        self.assertEqual(layout.slots_count, 6)
+        slot_tags = [e[0] for e in layout.element_slots if e[1] is not None]
+        self.assertEqual(slot_tags[layout.slot_lookup[pm.VmdDescriptor]], pm.Vmd.text)
+        self.assertEqual(slot_tags[layout.slot_lookup[pm.AlertSystemDescriptor]], pm.AlertSystem.text)
+        self.assertNotIn(pm.ChannelDescriptor, layout.slot_lookup)
+
+    def test_sort_child_nodes(self):
+        dc = descriptorcontainers.MdsDescriptorContainer(handle='123', parent_handle=None)
+        node = etree_.Element('Mds')
+        for tag in (pm.Vmd, pm.Type, ext.Extension, pm.Vmd, pm.AlertSystem):
+            etree_.SubElement(node, tag)
+        dc.sort_child_nodes(node)
+        self.assertEqual([n.tag for n in node],
+                         [ext.Extension.text, pm.Type.text, pm.AlertSystem.text, pm.Vmd.text, pm.Vmd.text])
+        etree_.SubElement(node, pm.Channel)
+        self.assertRaises(ValueError, dc.sort_child_nodes, node)
+
+    def test_sorted_container_properties(self):
+        dc = descriptorcontainers.NumericMetricDescriptorContainer(handle='123', parent_handle='456')
+        dc2 = descriptorcontainers.NumericMetricDescriptorContainer(handle='789', parent_handle='456')
+        props = dc.sorted_container_properties()
+        self.assertIs(props, dc2.sorted_container_properties())
+        names = [name for name, _ in props]
+        self.assertEqual(names[:2], ['Handle', 'DescriptorVersion'])
+        self.assertEqual(names[-1], 'AveragingPeriod')
+        for name, prop in props:
+            self.assertIs(prop, getattr(descriptorcontainers.NumericMetricDescriptorContainer, name))
+
+    def test_get_container_class(self):
+        get_cls = descriptorcontainers.get_container_class
+        self.assertIs(get_cls(pm.VmdDescriptor), descriptorcontainers.VmdDescriptorContainer)
+        self.assertIs(get_cls(pm.Vmd), descriptorcontainers.VmdDescriptorContainer)
+        self.assertIs(get_cls(pm.Vmd.text), descriptorcontainers.VmdDescriptorContainer)
+        self.assertIs(get_cls(etree_.QName(pm.Vmd.namespace, 'Vmd')), descriptorcontainers.VmdDescriptorContainer)
+        self.assertIsNone(get_cls(pm.VmdState))
+        self.assertIsNone(get_cls(None))
+        # the namespace is part of the key, an equal local name in another namespace is not found
+        self.assertIsNone(get_cls(etree_.QName('urn:example:other', 'VmdDescriptor')))
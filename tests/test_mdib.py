@@ -56,6 +56,30 @@ class TestMdib(unittest.TestCase):
                                                                                metric_code=Coding("98765"))
         self.assertIsNone(metric_container)
 
+    def test_rm_descriptor_by_handle(self):
+        device_mdib_container = ProviderMdib.from_mdib_file(mdib_70041_path,
+                                                            protocol_definition=definitions_sdc.SdcV1Definitions)
+        vmd = device_mdib_container.descriptions.handle.get_one('2.1.1')
+        subtree = device_mdib_container.get_all_descriptors_in_subtree(vmd)
+        self.assertGreater(len(subtree), 2)
+        descriptor_count = len(device_mdib_container.descriptions.objects)
+        device_mdib_container.rm_descriptor_by_handle('2.1.1')
+        self.assertEqual(len(device_mdib_container.descriptions.objects), descriptor_count - len(subtree))
+        for descriptor in subtree:
+            self.assertIsNone(device_mdib_container.descriptions.handle.get_one(descriptor.Handle, allow_none=True))
+            self.assertIsNone(device_mdib_container.states.descriptor_handle.get(descriptor.Handle))
+            self.assertIn(descriptor.Handle, device_mdib_container.descriptions.handle_version_lookup)
+            siblings = device_mdib_container.descriptions.parent_handle.get(descriptor.parent_handle, [])
+            self.assertFalse(any(sibling is descriptor for sibling in siblings))
+
+    def test_handles_are_shared(self):
+        """Verify that handles read from xml are interned, state and descriptor share the same string."""
+        device_mdib_container = ProviderMdib.from_mdib_file(mdib_70041_path,
+                                                            protocol_definition=definitions_sdc.SdcV1Definitions)
+        for state in device_mdib_container.states.objects:
+            descriptor = device_mdib_container.descriptions.handle.get_one(state.DescriptorHandle)
+            self.assertIs(state.DescriptorHandle, descriptor.Handle)
+
 
 class TestMdibTransaction(unittest.TestCase):
 
@@ -27,3 +27,13 @@ class TestNamespaces(unittest.TestCase):
 
         bla_string = hlp.doc_name_from_qname(bla_tag)
         self.assertEqual('bla', bla_string)
+
+    def test_tag_is_canonical(self):
+        hlp = namespaces.NamespaceHelper(namespaces.PrefixesEnum)
+        bla_tag = hlp.MSG.tag('bla')
+        self.assertIs(bla_tag, hlp.MSG.tag('bla'))
+        self.assertIs(bla_tag, namespaces.PrefixesEnum.MSG.tag('bla'))
+        self.assertIsNot(bla_tag, hlp.PM.tag('bla'))
+
+    def test_qn_type_is_canonical(self):
+        self.assertIs(namespaces.QN_TYPE, namespaces.default_ns_helper.XSI.tag('type'))
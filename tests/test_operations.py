@@ -219,6 +219,51 @@ class Test_BuiltinOperations(unittest.TestCase):
         my_patient2 = self.sdc_device.mdib.context_states.handle.get_one(my_patient.Handle)
         self.assertEqual(my_patient2.CoreData.Givenname, 'Karl123')
 
+    def test_set_two_new_patient_contexts(self):
+        """Verify that more than one new context state for the same descriptor can be set in one call.
+
+        The descriptor already has an associated state, it must be disassociated only once.
+        """
+        client_mdib = ConsumerMdib(self.sdc_client)
+        client_mdib.init_mdib()
+        patient_descriptor_container = self.sdc_device.mdib.descriptions.NODETYPE.get_one(
+            pm.PatientContextDescriptor)
+        my_operations = self.sdc_device.mdib.get_operation_descriptors_for_descriptor_handle(
+            patient_descriptor_container.Handle,
+            NODETYPE=pm.SetContextStateOperationDescriptor)
+        operation_handle = my_operations[0].Handle
+        context = self.sdc_client.client('Context')
+
+        proposed_context = context.mk_proposed_context_object(patient_descriptor_container.Handle)
+        proposed_context.CoreData.Givenname = 'Karl'
+        future = context.set_context_state(operation_handle, [proposed_context])
+        result = future.result(timeout=SET_TIMEOUT)
+        self.assertEqual(result.InvocationInfo.InvocationState, msg_types.InvocationState.FINISHED)
+        first_handle = result.OperationTarget
+
+        proposed_contexts = []
+        for name in ('Heidi', 'Peter'):
+            proposed_context = context.mk_proposed_context_object(patient_descriptor_container.Handle)
+            proposed_context.CoreData.Givenname = name
+            proposed_contexts.append(proposed_context)
+        future = context.set_context_state(operation_handle, proposed_contexts)
+        result = future.result(timeout=SET_TIMEOUT)
+        self.assertEqual(result.InvocationInfo.InvocationState, msg_types.InvocationState.FINISHED)
+        first_patient = self.sdc_device.mdib.context_states.handle.get_one(first_handle)
+        self.assertEqual(first_patient.ContextAssociation, pm_types.ContextAssociation.DISASSOCIATED)
+        new_patients = [st for st in self.sdc_device.mdib.context_states.NODETYPE.get(pm.PatientContextState)
+                        if st.CoreData.Givenname in ('Heidi', 'Peter')]
+        self.assertEqual(len(new_patients), 2)
+        for patient in new_patients:
+            self.assertEqual(patient.ContextAssociation, pm_types.ContextAssociation.ASSOCIATED)
+            self.assertIsNone(patient.UnbindingMdibVersion)
+            self.assertIsNone(patient.BindingEndTime)
+        # all states are bound or unbound by the same operation, therefore they have the same version and time
+        self.assertEqual(new_patients[0].BindingMdibVersion, new_patients[1].BindingMdibVersion)
+        self.assertEqual(new_patients[0].BindingStartTime, new_patients[1].BindingStartTime)
+        self.assertEqual(first_patient.UnbindingMdibVersion, new_patients[0].BindingMdibVersion)
+        self.assertEqual(first_patient.BindingEndTime, new_patients[0].BindingStartTime)
+
     def test_location_context(self):
         # initially the device shall have one location, and the client must have it in its mdib
         device_mdib = self.sdc_device.mdib
@@ -630,6 +675,15 @@ class Test_BuiltinOperations(unittest.TestCase):
             state = client_mdib.states.descriptor_handle.get_one(my_operation_descriptor.OperationTarget)
             self.assertEqual(state.MetricValue.Value, value)
 
+        # SF1823: the operation target is a setting, therefore the operation makes its value valid
+        with self.sdc_device.mdib.metric_state_transaction() as mgr:
+            state = mgr.get_state(my_operation_descriptor.OperationTarget)
+            state.MetricValue.MetricQuality.Validity = pm_types.MeasurementValidity.QUESTIONABLE
+        future = set_service.set_string(operation_handle=operation_handle, requested_string='ADULT')
+        future.result(timeout=SET_TIMEOUT)
+        state = self.sdc_device.mdib.states.descriptor_handle.get_one(my_operation_descriptor.OperationTarget)
+        self.assertEqual(state.MetricValue.MetricQuality.Validity, pm_types.MeasurementValidity.VALID)
+
     def test_set_metric_value(self):
         """Verify that metricprovider instantiated an operation for SetNumericValue call.
 
@@ -655,3 +709,12 @@ class Test_BuiltinOperations(unittest.TestCase):
             # verify that the corresponding state has been updated
             state = client_mdib.states.descriptor_handle.get_one(my_operation_descriptor.OperationTarget)
             self.assertEqual(state.MetricValue.Value, value)
+
+        # SF1823: the operation target is a setting, therefore the operation makes its value valid
+        with self.sdc_device.mdib.metric_state_transaction() as mgr:
+            state = mgr.get_state(my_operation_descriptor.OperationTarget)
+            state.MetricValue.MetricQuality.Validity = pm_types.MeasurementValidity.QUESTIONABLE
+        future = set_service.set_numeric_value(operation_handle=operation_handle, requested_numeric_value=Decimal(2))
+        future.result(timeout=SET_TIMEOUT)
+        state = self.sdc_device.mdib.states.descriptor_handle.get_one(my_operation_descriptor.OperationTarget)
+        self.assertEqual(state.MetricValue.MetricQuality.Validity, pm_types.MeasurementValidity.VALID)
@@ -1,4 +1,5 @@
 import unittest
+from decimal import Decimal
 from unittest import mock
 from lxml.etree import QName, fromstring, tostring
 
@@ -27,6 +28,22 @@ class TestPmTypes(unittest.TestCase):
         c3.Translation.append(pm_types.Translation('41'))  # same translation as c2
         self.assertTrue(c2.is_equivalent(c3))
 
+    def test_coded_value_from_node(self):
+        text = """<pm:Type xmlns:pm="http://standards.ieee.org/downloads/11073/11073-10207-2017/participant"
+                Code="42" CodingSystemVersion="1">
+                <pm:ConceptDescription Lang="en-US">foo</pm:ConceptDescription>
+                <pm:Translation Code="41" CodingSystem="abc"/>
+              </pm:Type>"""
+        node = fromstring(text)  # noqa: S320
+        coded_value = pm_types.CodedValue.from_node(node)
+        expected = pm_types.CodedValue('42', coding_system_version='1',
+                                       concept_descriptions=[pm_types.LocalizedText('foo', lang='en-US')])
+        expected.Translation.append(pm_types.Translation('41', coding_system='abc'))
+        self.assertEqual(coded_value, expected)
+        self.assertEqual(coded_value.CodingSystem, pm_types.DEFAULT_CODING_SYSTEM)
+        self.assertIsNone(coded_value.SymbolicCodeName)
+        self.assertEqual(coded_value.CodingSystemName, [])
+
     def test_have_matching_codes(self):
         c1 = pm_types.CodedValue('42', coding_system='abc')
         c1.Translation.append(pm_types.Translation('41'))
@@ -37,6 +54,30 @@ class TestPmTypes(unittest.TestCase):
         c2 = pm_types.CodedValue('xxx', coding_system='abc')
         c2.Translation.append(pm_types.Translation('41'))
         self.assertTrue(pm_types.have_matching_codes(c1, c2))
+        self.assertTrue(pm_types.have_matching_codes(pm_types.Coding('41'), c2))
+        self.assertTrue(pm_types.have_matching_codes(pm_types.Coding('41'), pm_types.Coding('41')))
+        self.assertFalse(pm_types.have_matching_codes(pm_types.Coding('41'), pm_types.Coding('42')))
+        self.assertFalse(pm_types.have_matching_codes(c2, pm_types.CodedValue('41', coding_system='abc')))
+
+    def test_sorted_container_properties(self):
+        """Verify that the properties are calculated once per class, in _props order of base classes first."""
+        c1 = pm_types.CodedValue('42')
+        props = c1.sorted_container_properties()
+        self.assertIs(props, pm_types.CodedValue('43').sorted_container_properties())
+        self.assertEqual([name for name, _ in props], list(pm_types.CodedValue._props))
+        self.assertIs(props[0][1], pm_types.CodedValue.__dict__['ExtExtension'])
+        names = [name for name, _ in pm_types.Translation('41').sorted_container_properties()]
+        self.assertEqual(names, ['ExtExtension', 'Code', 'CodingSystem', 'CodingSystemVersion'])
+
+    def test_equality(self):
+        c1 = pm_types.CodedValue('42', coding_system='abc')
+        self.assertEqual(c1, c1)
+        self.assertEqual(c1, pm_types.CodedValue('42', coding_system='abc'))
+        self.assertNotEqual(c1, pm_types.CodedValue('42'))
+        self.assertNotEqual(c1, None)
+        # instances of other classes are equal if they have the same values for all properties
+        self.assertEqual(pm_types.Translation('42', coding_system='abc'), c1)
+        self.assertNotEqual(c1, pm_types.Translation('42', coding_system='abc'))  # Translation has less properties
 
     def test_allowed_value(self):
         """Verify that value is an empty string if text of Value node is empty."""
@@ -74,6 +115,31 @@ class TestPmTypes(unittest.TestCase):
         arg2 = pm_types.ActivateOperationDescriptorArgument.from_node(node2)
         self.assertEqual(arg, arg2)
 
+    def test_from_node_without_init(self):
+        """Verify that classes which skip __init__ in from_node are completely set up from node."""
+        pm_qname = QName('http://standards.ieee.org/downloads/11073/11073-10207-2017/participant', 'Test')
+        ns_map = {'pm': pm_qname.namespace}
+        objects = (pm_types.SystemSignalActivation(pm_types.AlertSignalManifestation.VIS,
+                                                   pm_types.AlertActivation.PAUSED),
+                   pm_types.ProductionSpecification(pm_types.CodedValue('42'), 'spec'),
+                   pm_types.Measurement(Decimal('1.5'), pm_types.CodedValue('262656')),
+                   pm_types.RetrievabilityInfo(pm_types.RetrievabilityMethod.PERIODIC, update_period=2.0))
+        for obj in objects:
+            node = obj.as_etree_node(pm_qname, ns_map)
+            obj2 = obj.__class__.from_node(node)
+            self.assertEqual(obj, obj2)
+            self.assertEqual(tostring(node), tostring(obj2.as_etree_node(pm_qname, ns_map)))
+
+    def test_value_class_from_node(self):
+        """Verify that xsi:type of a node selects the matching class."""
+        text = """<pm:Value xmlns:pm="http://standards.ieee.org/downloads/11073/11073-10207-2017/participant"
+                            xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:type="pm:{}"/>
+        """
+        node = fromstring(text.format('InstanceIdentifier')) # noqa: S320
+        self.assertIs(pm_types.PropertyBasedPMType.value_class_from_node(node), pm_types.InstanceIdentifier)
+        node = fromstring(text.format('Unknown')) # noqa: S320
+        self.assertRaises(KeyError, pm_types.PropertyBasedPMType.value_class_from_node, node)
+
 
 class TestExtensions(unittest.TestCase):
 
@@ -623,3 +623,10 @@ class TestStateContainers(unittest.TestCase):
         state2.update_from_other_container(state)
         self.assertEqual(len(state2.AllowedRange), 2)
         self.assertEqual(state.AllowedRange, state2.AllowedRange)
+
+    def test_get_container_class(self):
+        """Verify that lookup works with QName and with its text."""
+        self.assertIs(sc.get_container_class(pm.NumericMetricState), sc.NumericMetricStateContainer)
+        self.assertIs(sc.get_container_class(pm.NumericMetricState.text), sc.NumericMetricStateContainer)
+        self.assertIsNone(sc.get_container_class(pm.Mds))
+        self.assertIsNone(sc.get_container_class(None))
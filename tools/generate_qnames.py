@@ -27,12 +27,12 @@ def generate_qnames(doc):
 
 def write_names_file(names, ns_helper, ns_name, fd):
     fd.write('# generated by "generate_qnames"\n' )
-    fd.write(f'from ..namespaces import {ns_helper}\n\n')
-    fd.write('')
+    fd.write(f'from sdc11073.namespaces import {ns_helper}\n\n')
+    fd.write(f'_tag = {ns_helper}.{ns_name}.tag\n\n')
     names_list = [n.localname for n in names.values()]
     names_list.sort()
     for name in names_list:
-        fd.write(f"{name} = {ns_helper}.{ns_name}.tag('{name}')\n")
+        fd.write(f"{name} = _tag('{name}')\n")
 
 
 if __name__ == '__main__':